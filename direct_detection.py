@@ -9,7 +9,67 @@ helping to avoid path issues when called from Next.js
 import os
 import sys
 import json
+import base64
 import traceback
+from collections import namedtuple
+
+# orjson parses and serializes in C; fall back to the stdlib when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Marks a result value as a file on disk to be embedded as a base64 string
+EmbeddedFile = namedtuple('EmbeddedFile', ['path'])
+
+# Read size for embedded files; a multiple of 3 so chunks base64-encode without padding
+EMBED_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def _dumps(value):
+    """Serialize a JSON value to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def _write_embedded_file(out, path):
+    """Stream a file into out as a base64 JSON string, one chunk at a time"""
+    out.write(b'"')
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(EMBED_CHUNK_SIZE), b''):
+            out.write(base64.b64encode(chunk))
+    out.write(b'"')
+
+
+def _write_json(out, value):
+    """Write a JSON value incrementally, descending into dicts"""
+    if isinstance(value, EmbeddedFile):
+        _write_embedded_file(out, value.path)
+    elif isinstance(value, dict):
+        out.write(b'{')
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                out.write(b',')
+            out.write(_dumps(str(key)))
+            out.write(b':')
+            _write_json(out, item)
+        out.write(b'}')
+    else:
+        out.write(_dumps(value))
+
+
+def write_result(output_file, result):
+    """
+    Write the detection result to output_file as JSON.
+    
+    The result is streamed key by key, and EmbeddedFile values (e.g. alert imagery)
+    are base64-encoded straight from disk, so the encoded payload is never held
+    in memory alongside the result dict.
+    """
+    with open(output_file, 'wb') as out:
+        _write_json(out, result)
 
 def main():
     """Main function to run the script"""
@@ -39,8 +99,8 @@ def main():
         
     try:
         # Try to read the input file
-        with open(input_file, 'r') as f:
-            aoi_data = json.load(f)
+        with open(input_file, 'rb') as f:
+            aoi_data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
             print(f"Successfully read input file. AOI type: {aoi_data.get('alertType', 'unknown')}")
         
         # Create a dummy result for now - this would call the actual ML code in production
@@ -62,8 +122,7 @@ def main():
         }
         
         # Write output to the specified file
-        with open(output_file, 'w') as f:
-            json.dump(result, f)
+        write_result(output_file, result)
         
         print(f"Successfully wrote results to {output_file}")
         return 0
@@ -1,8 +1,13 @@
-# Import all algorithm implementations
-from .deforestation import DeforestationDetection
-from .urban_development import UrbanDevelopmentDetection
-from .water_body_change import WaterBodyChangeDetection
-from .land_use_change import LandUseChangeDetection
+# Import all algorithm implementations lazily so only the requested algorithm
+# (and its Earth Engine dependencies) is loaded
+import importlib
+
+_LAZY_IMPORTS = {
+    'DeforestationDetection': '.deforestation',
+    'UrbanDevelopmentDetection': '.urban_development',
+    'WaterBodyChangeDetection': '.water_body_change',
+    'LandUseChangeDetection': '.land_use_change'
+}
 
 __all__ = [
     'DeforestationDetection',
@@ -10,3 +15,16 @@ __all__ = [
     'WaterBodyChangeDetection',
     'LandUseChangeDetection'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
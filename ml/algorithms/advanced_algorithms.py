@@ -11,10 +11,213 @@ This module implements state-of-the-art change detection algorithms including:
 """
 
 import ee
+import functools
+import threading
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from .base_algorithm import BaseAlgorithm
 
+# Numba is optional; it only accelerates post-processing of arrays pulled out of EE
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# SciPy is only needed for texture computation on tiles downloaded as NumPy arrays
+try:
+    from scipy import ndimage
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+# AOIs smaller than this (m^2) are dominated by noise, so detection is skipped for them
+MIN_AREA_M2 = 1e4
+
+
+def _skip_tiny_aoi(change_mask, aoi_geometry):
+    """
+    Replace the change mask with an all-zero image when the AOI is below MIN_AREA_M2.
+    
+    The branch is taken server-side, so the detection graph is never evaluated for
+    tiny AOIs and no round trip is needed to measure the area.
+    """
+    empty_mask = ee.Image.constant(0).rename(change_mask.bandNames()).clip(aoi_geometry)
+    return ee.Image(ee.Algorithms.If(
+        aoi_geometry.area(1).lt(MIN_AREA_M2),
+        empty_mask,
+        change_mask
+    ))
+
+
+# Kernels and reducers are immutable, so build each one once on first use
+# (lazily, because constructing them requires an initialized Earth Engine session)
+@functools.lru_cache(maxsize=None)
+def _square_kernel(radius, normalize=True):
+    """Shared square kernel of the given pixel radius"""
+    return ee.Kernel.square(radius, 'pixels', normalize)
+
+
+@functools.lru_cache(maxsize=None)
+def _gaussian_kernel(radius, sigma):
+    """Shared normalized gaussian kernel"""
+    return ee.Kernel.gaussian(radius, sigma)
+
+
+@functools.lru_cache(maxsize=None)
+def _reducer(name):
+    """Shared ee.Reducer instance by name, e.g. 'mean' or 'max'"""
+    return getattr(ee.Reducer, name)()
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _threshold_mask(scores, threshold):
+        """Binary change mask (uint8) of scores above threshold, rows in parallel"""
+        out = np.empty(scores.shape, np.uint8)
+        for i in numba.prange(scores.shape[0]):
+            for j in range(scores.shape[1]):
+                out[i, j] = 1 if scores[i, j] > threshold else 0
+        return out
+else:
+    def _threshold_mask(scores, threshold):
+        """Binary change mask (uint8) of scores above threshold"""
+        return (scores > threshold).astype(np.uint8)
+
+
+def threshold_scores_numpy(scores, threshold=0.5):
+    """
+    Threshold a 2-D change-score array downloaded from Earth Engine
+    (e.g. via sampleRectangle or getDownloadURL) into a uint8 change mask.
+    """
+    scores = np.asarray(scores, dtype=np.float32)
+    if scores.ndim != 2:
+        raise ValueError(f"Expected a 2-D score array, got shape {scores.shape}")
+    return _threshold_mask(scores, np.float32(threshold))
+
+
+def _identity_cache(maxsize=128):
+    """
+    LRU-memoize a function on the identity of its (EE object) arguments.
+    
+    EE objects are built client-side, so the same before/after image object fed to
+    several algorithms would otherwise have its derived graph rebuilt by each one.
+    The cache holds the arguments themselves, so an id() cannot be reused while its
+    entry is alive.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        def remember(args, result):
+            key = tuple(id(arg) for arg in args)
+            with lock:
+                cache[key] = (args, result)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = tuple(id(arg) for arg in args)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    cache.move_to_end(key)
+                    return entry[1]
+            result = func(*args)
+            remember(args, result)
+            return result
+        
+        wrapper.remember = remember
+        return wrapper
+    return decorator
+
+
+@_identity_cache()
+def _with_indices(image):
+    """
+    Return the image with ndvi, ndbi, mndwi, savi and evi bands added.
+    
+    The result is memoized per image object so the algorithms below can ask for
+    the same index repeatedly without adding duplicate nodes to the EE graph.
+    """
+    nir = image.select('B8')
+    red = image.select('B4')
+    
+    indexed = image.addBands(ee.Image.cat([
+        image.normalizedDifference(['B8', 'B4']).rename('ndvi'),
+        image.normalizedDifference(['B11', 'B8']).rename('ndbi'),
+        image.normalizedDifference(['B3', 'B11']).rename('mndwi'),
+        # SAVI (Soil Adjusted Vegetation Index) - better for sparse vegetation
+        image.expression(
+            '(1.5 * (NIR - RED)) / (NIR + RED + 0.5)',
+            {'NIR': nir, 'RED': red}
+        ).rename('savi'),
+        image.expression(
+            '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))',
+            {'NIR': nir, 'RED': red, 'BLUE': image.select('B2')}
+        ).rename('evi')
+    ]))
+    
+    # An image that already carries the indices maps to itself
+    _with_indices.remember((indexed,), indexed)
+    return indexed
+
+
+@_identity_cache()
+def _spectral_indices(image):
+    """NDVI, NDBI, MNDWI and SAVI bands of an image"""
+    return _with_indices(image).select(['ndvi', 'ndbi', 'mndwi', 'savi'])
+
+
+@_identity_cache()
+def _multiscale_features(image):
+    """Spectral indices plus boxcar means of the visible/NIR bands at three scales"""
+    # Spectral indices
+    indices = _with_indices(image).select(['ndvi', 'ndbi', 'mndwi'])
+    
+    # Multi-scale spatial features
+    # Normalized boxcar convolutions are separable, so each scale is O(k) per pixel
+    # and all three scales share a single band selection
+    spatial_bands = ['B2', 'B3', 'B4', 'B8']
+    spatial_stack = image.select(spatial_bands)
+    
+    scale_features = [
+        spatial_stack.convolve(_square_kernel(radius))
+        .rename([f'{band}_mean_{radius}' for band in spatial_bands])
+        for radius in (3, 5, 7)
+    ]
+    
+    # Combine features
+    features = ee.Image.cat([indices] + scale_features)
+    
+    return features
+
+
+@_identity_cache()
+def _sentinel1_image(optical_image, aoi_geometry):
+    """Sentinel-1 IW/VV scene within 3 days of the optical image"""
+    # Get date from optical image
+    optical_date = ee.Date(optical_image.get('system:time_start'))
+    
+    # Search for Sentinel-1 data within 3 days
+    s1_collection = ee.ImageCollection('COPERNICUS/S1_GRD').filter(ee.Filter.And(
+        ee.Filter.bounds(aoi_geometry),
+        ee.Filter.date(optical_date.advance(-3, 'day'), optical_date.advance(3, 'day')),
+        ee.Filter.listContains('transmitterReceiverPolarisation', 'VV'),
+        ee.Filter.eq('instrumentMode', 'IW')
+    ))
+    
+    # Branch server-side; absence is flagged through the 's1_available' property
+    return ee.Image(ee.Algorithms.If(
+        s1_collection.size().gt(0),
+        s1_collection.first().set('s1_available', 1),
+        ee.Image.constant(0).rename('VV').set('s1_available', 0)
+    ))
+
 
 class TransformerChangeDetection(BaseAlgorithm):
     """
@@ -22,11 +225,9 @@ class TransformerChangeDetection(BaseAlgorithm):
     Based on latest research: "Pushing Trade-Off Boundaries: Compact yet Effective Remote Sensing Change Detection"
     """
     
-    def __init__(self):
-        super().__init__()
-        self.name = "transformer_change_detection"
-        self.description = "Advanced transformer-based change detection with attention mechanisms"
-        
+    name = "transformer_change_detection"
+    description = "Advanced transformer-based change detection with attention mechanisms"
+    
     def detect_change(self, before_image, after_image, aoi_geometry, threshold=0.5):
         """
         Detect changes using transformer-inspired attention mechanisms
@@ -41,38 +242,11 @@ class TransformerChangeDetection(BaseAlgorithm):
         # Apply threshold
         change_mask = change_scores.gt(threshold)
         
-        return change_mask.rename('transformer_change_score')
+        return _skip_tiny_aoi(change_mask.rename('transformer_change_score'), aoi_geometry)
     
     def _extract_multiscale_features(self, image):
         """Extract multi-scale features using different kernel sizes"""
-        # Spectral indices
-        ndvi = image.normalizedDifference(['B8', 'B4']).rename('ndvi')
-        ndbi = image.normalizedDifference(['B11', 'B8']).rename('ndbi')
-        mndwi = image.normalizedDifference(['B3', 'B11']).rename('mndwi')
-        
-        # Multi-scale spatial features
-        scale_3x3 = image.select(['B2', 'B3', 'B4', 'B8']).reduceNeighborhood(
-            reducer=ee.Reducer.mean(),
-            kernel=ee.Kernel.square(3)
-        )
-        
-        scale_5x5 = image.select(['B2', 'B3', 'B4', 'B8']).reduceNeighborhood(
-            reducer=ee.Reducer.mean(),
-            kernel=ee.Kernel.square(5)
-        )
-        
-        scale_7x7 = image.select(['B2', 'B3', 'B4', 'B8']).reduceNeighborhood(
-            reducer=ee.Reducer.mean(),
-            kernel=ee.Kernel.square(7)
-        )
-        
-        # Combine features
-        features = ee.Image.cat([
-            ndvi, ndbi, mndwi,
-            scale_3x3, scale_5x5, scale_7x7
-        ])
-        
-        return features
+        return _multiscale_features(image)
     
     def _temporal_attention_fusion(self, features_before, features_after):
         """
@@ -81,30 +255,31 @@ class TransformerChangeDetection(BaseAlgorithm):
         # Calculate absolute differences
         diff_features = features_after.subtract(features_before).abs()
         
-        # Calculate relative changes
-        relative_change = diff_features.divide(features_before.add(0.001))
-        
-        # Attention-weighted fusion
-        attention_weights = relative_change.reduceNeighborhood(
-            reducer=ee.Reducer.mean(),
-            kernel=ee.Kernel.square(3)
+        # Attention scores from the scale-free relative difference |a - b| / (|a| + |b|),
+        # which lies in [0, 1] whatever the band scaling, so exp() below cannot overflow;
+        # scaled by sqrt(D), as in scaled dot-product attention
+        relative_diff = diff_features.divide(
+            features_after.abs().add(features_before.abs()).add(1e-6)
         )
-        
-        # Normalize attention weights
-        attention_weights = attention_weights.divide(
-            attention_weights.reduceRegion(
-                reducer=ee.Reducer.max(),
-                geometry=features_before.geometry(),
-                scale=10,
-                maxPixels=1e9
-            ).values().reduce(ee.Reducer.max())
+        scores = relative_diff.divide(ee.Number(diff_features.bandNames().size()).sqrt())
+        
+        # Softmax over the local 7x7 neighborhood, rescaled by the window size (i.e.
+        # normalized by the neighborhood mean rather than the sum) so a uniform
+        # neighborhood gets weight 1, the range the change threshold was tuned for.
+        # Every step stays tile-local, so no whole-AOI normalization is needed
+        exp_scores = scores.exp()
+        attention_weights = exp_scores.divide(
+            exp_scores.reduceNeighborhood(
+                reducer=_reducer('mean'),
+                kernel=_square_kernel(3, False)
+            )
         )
         
         # Apply attention to differences
         attended_changes = diff_features.multiply(attention_weights)
         
-        # Final change score
-        change_score = attended_changes.reduce(ee.Reducer.mean())
+        # Final change score (band mean, the scale the detection threshold is set for)
+        change_score = attended_changes.reduce(_reducer('mean'))
         
         return change_score
 
@@ -115,11 +290,9 @@ class TemporalConsistencyDetection(BaseAlgorithm):
     Based on research: "SHAZAM: Self-Supervised Change Monitoring for Hazard Detection"
     """
     
-    def __init__(self):
-        super().__init__()
-        self.name = "temporal_consistency_detection"
-        self.description = "Temporal consistency modeling to reduce false positives from seasonal variations"
-        
+    name = "temporal_consistency_detection"
+    description = "Temporal consistency modeling to reduce false positives from seasonal variations"
+    
     def detect_change(self, before_image, after_image, aoi_geometry, threshold=0.5):
         """
         Detect changes using temporal consistency modeling
@@ -139,7 +312,7 @@ class TemporalConsistencyDetection(BaseAlgorithm):
         # Apply threshold
         change_mask = change_scores.gt(threshold)
         
-        return change_mask.rename('temporal_consistency_score')
+        return _skip_tiny_aoi(change_mask.rename('temporal_consistency_score'), aoi_geometry)
     
     def _get_historical_baseline(self, reference_image, aoi_geometry):
         """Get historical data for baseline comparison"""
@@ -156,10 +329,12 @@ class TemporalConsistencyDetection(BaseAlgorithm):
             .filter(ee.Filter.calendarRange(ref_date.get('month'), ref_date.get('month'), 'month')) \
             .map(self._preprocess_sentinel2)
         
-        if historical_collection.size().getInfo() > 0:
-            return historical_collection.median()
-        else:
-            return reference_image
+        # Branch server-side so the size check does not cost a blocking round trip
+        return ee.Image(ee.Algorithms.If(
+            historical_collection.size().gt(0),
+            historical_collection.median(),
+            reference_image
+        ))
     
     def _build_seasonal_model(self, historical_baseline, current_baseline):
         """Build seasonal adjustment model"""
@@ -168,8 +343,8 @@ class TemporalConsistencyDetection(BaseAlgorithm):
         
         # Smooth seasonal patterns
         seasonal_model = seasonal_diff.reduceNeighborhood(
-            reducer=ee.Reducer.mean(),
-            kernel=ee.Kernel.gaussian(30, 15)  # Spatial smoothing
+            reducer=_reducer('mean'),
+            kernel=_gaussian_kernel(30, 15)  # Spatial smoothing
         )
         
         return seasonal_model
@@ -187,34 +362,29 @@ class TemporalConsistencyDetection(BaseAlgorithm):
         indices_before = self._calculate_spectral_indices(before_image)
         indices_after = self._calculate_spectral_indices(after_image)
         
-        # Calculate normalized differences
-        normalized_changes = indices_after.subtract(indices_before).divide(
-            indices_before.add(0.001)
-        ).abs()
-        
-        # Combine multiple indices with weights
-        weights = ee.Image([0.3, 0.3, 0.2, 0.2])  # NDVI, NDBI, MNDWI, SAVI
-        
-        consistency_score = normalized_changes.multiply(weights).reduce(ee.Reducer.sum())
+        # Relative change of each index, weighted and summed in one fused expression
+        consistency_score = indices_before.expression(
+            '0.3 * abs((NDVI_A - NDVI_B) / (NDVI_B + 0.001)) + '
+            '0.3 * abs((NDBI_A - NDBI_B) / (NDBI_B + 0.001)) + '
+            '0.2 * abs((MNDWI_A - MNDWI_B) / (MNDWI_B + 0.001)) + '
+            '0.2 * abs((SAVI_A - SAVI_B) / (SAVI_B + 0.001))',
+            {
+                'NDVI_B': indices_before.select('ndvi'),
+                'NDVI_A': indices_after.select('ndvi'),
+                'NDBI_B': indices_before.select('ndbi'),
+                'NDBI_A': indices_after.select('ndbi'),
+                'MNDWI_B': indices_before.select('mndwi'),
+                'MNDWI_A': indices_after.select('mndwi'),
+                'SAVI_B': indices_before.select('savi'),
+                'SAVI_A': indices_after.select('savi')
+            }
+        )
         
         return consistency_score
     
     def _calculate_spectral_indices(self, image):
         """Calculate multiple spectral indices"""
-        ndvi = image.normalizedDifference(['B8', 'B4']).rename('ndvi')
-        ndbi = image.normalizedDifference(['B11', 'B8']).rename('ndbi') 
-        mndwi = image.normalizedDifference(['B3', 'B11']).rename('mndwi')
-        
-        # SAVI (Soil Adjusted Vegetation Index) - better for sparse vegetation
-        savi = image.expression(
-            '(1.5 * (NIR - RED)) / (NIR + RED + 0.5)',
-            {
-                'NIR': image.select('B8'),
-                'RED': image.select('B4')
-            }
-        ).rename('savi')
-        
-        return ee.Image.cat([ndvi, ndbi, mndwi, savi])
+        return _spectral_indices(image)
 
 
 class MultiSensorFusionDetection(BaseAlgorithm):
@@ -223,11 +393,9 @@ class MultiSensorFusionDetection(BaseAlgorithm):
     Combines optical (Sentinel-2) with radar (Sentinel-1) data when available.
     """
     
-    def __init__(self):
-        super().__init__()
-        self.name = "multisensor_fusion_detection"
-        self.description = "Multi-sensor fusion combining optical and radar data for robust detection"
-        
+    name = "multisensor_fusion_detection"
+    description = "Multi-sensor fusion combining optical and radar data for robust detection"
+    
     def detect_change(self, before_image, after_image, aoi_geometry, threshold=0.5):
         """
         Detect changes using multi-sensor fusion
@@ -240,56 +408,51 @@ class MultiSensorFusionDetection(BaseAlgorithm):
         optical_changes = self._detect_optical_changes(before_image, after_image)
         
         # Radar change detection (if available)
-        if s1_before and s1_after:
-            radar_changes = self._detect_radar_changes(s1_before, s1_after)
-            
-            # Fusion of optical and radar
-            fused_changes = self._fuse_optical_radar(optical_changes, radar_changes)
-        else:
-            # Fallback to optical only with enhanced processing
-            fused_changes = self._enhanced_optical_detection(optical_changes, before_image, after_image)
+        radar_available = ee.Number(s1_before.get('s1_available')).And(
+            ee.Number(s1_after.get('s1_available'))
+        )
+        radar_changes = self._detect_radar_changes(s1_before, s1_after)
+        
+        # Fusion of optical and radar, falling back to optical only with enhanced processing
+        fused_changes = ee.Image(ee.Algorithms.If(
+            radar_available,
+            self._fuse_optical_radar(optical_changes, radar_changes),
+            self._enhanced_optical_detection(optical_changes, before_image, after_image)
+        ))
         
         # Apply threshold
         change_mask = fused_changes.gt(threshold)
         
-        return change_mask.rename('multisensor_fusion_score')
+        return _skip_tiny_aoi(change_mask.rename('multisensor_fusion_score'), aoi_geometry)
     
     def _get_sentinel1_data(self, optical_image, aoi_geometry):
         """Get corresponding Sentinel-1 radar data"""
-        # Get date from optical image
-        optical_date = ee.Date(optical_image.get('system:time_start'))
-        
-        # Search for Sentinel-1 data within 3 days
-        s1_collection = ee.ImageCollection('COPERNICUS/S1_GRD') \
-            .filterBounds(aoi_geometry) \
-            .filterDate(optical_date.advance(-3, 'day'), optical_date.advance(3, 'day')) \
-            .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
-            .filter(ee.Filter.eq('instrumentMode', 'IW'))
-        
-        if s1_collection.size().getInfo() > 0:
-            return s1_collection.first()
-        else:
-            return None
+        return _sentinel1_image(optical_image, aoi_geometry)
     
     def _detect_optical_changes(self, before_image, after_image):
         """Detect changes in optical data"""
         # Enhanced spectral analysis
-        ndvi_before = before_image.normalizedDifference(['B8', 'B4'])
-        ndvi_after = after_image.normalizedDifference(['B8', 'B4'])
+        ndvi_before = _with_indices(before_image).select('ndvi')
+        ndvi_after = _with_indices(after_image).select('ndvi')
         
-        ndbi_before = before_image.normalizedDifference(['B11', 'B8'])
-        ndbi_after = after_image.normalizedDifference(['B11', 'B8'])
+        ndbi_before = _with_indices(before_image).select('ndbi')
+        ndbi_after = _with_indices(after_image).select('ndbi')
         
-        # Multi-spectral change vector analysis
-        change_vector = ee.Image.cat([
-            ndvi_after.subtract(ndvi_before),
-            ndbi_after.subtract(ndbi_before),
-            after_image.select('B4').subtract(before_image.select('B4')),
-            after_image.select('B8').subtract(before_image.select('B8'))
-        ])
-        
-        # Calculate change magnitude
-        change_magnitude = change_vector.pow(2).reduce(ee.Reducer.sum()).sqrt()
+        # Multi-spectral change vector magnitude, fused into a single per-pixel expression
+        change_magnitude = after_image.expression(
+            'sqrt((NDVI_A - NDVI_B) ** 2 + (NDBI_A - NDBI_B) ** 2 + '
+            '(RED_A - RED_B) ** 2 + (NIR_A - NIR_B) ** 2)',
+            {
+                'NDVI_A': ndvi_after,
+                'NDVI_B': ndvi_before,
+                'NDBI_A': ndbi_after,
+                'NDBI_B': ndbi_before,
+                'RED_A': after_image.select('B4'),
+                'RED_B': before_image.select('B4'),
+                'NIR_A': after_image.select('B8'),
+                'NIR_B': before_image.select('B8')
+            }
+        )
         
         return change_magnitude
     
@@ -342,6 +505,31 @@ class MultiSensorFusionDetection(BaseAlgorithm):
         texture = contrast.add(entropy).divide(2)
         
         return texture
+    
+    @staticmethod
+    def _local_std_numpy(nir_array, size=3):
+        """
+        Local standard deviation over size x size windows of a B8 tile downloaded as a
+        NumPy array (edges reflected).
+        
+        This is a different feature from _calculate_texture's GLCM contrast + entropy and
+        is not interchangeable with it; it is a cheap local-roughness measure for tiles
+        already held on the client.
+        """
+        if not SCIPY_AVAILABLE:
+            raise ImportError("scipy is required for the NumPy local standard deviation")
+        
+        nir_array = np.asarray(nir_array, dtype=np.float32)
+        
+        # vectorized_filter (SciPy >= 1.16) evaluates windows in batches, not per pixel
+        if hasattr(ndimage, 'vectorized_filter'):
+            return ndimage.vectorized_filter(nir_array, np.std, size=size, mode='reflect',
+                                             batch_memory=1 << 28)
+        
+        # Older SciPy: std from two separable box means, sqrt(E[x^2] - E[x]^2)
+        mean = ndimage.uniform_filter(nir_array, size=size, mode='reflect')
+        mean_sq = ndimage.uniform_filter(nir_array * nir_array, size=size, mode='reflect')
+        return np.sqrt(np.maximum(mean_sq - mean * mean, 0))
 
 
 class SpectralTemporalAnalysis(BaseAlgorithm):
@@ -350,10 +538,8 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
     Based on research: "Leveraging Satellite Image Time Series for Accurate Extreme Event Detection"
     """
     
-    def __init__(self):
-        super().__init__()
-        self.name = "spectral_temporal_analysis"
-        self.description = "Advanced spectral-temporal analysis for specific change detection"
+    name = "spectral_temporal_analysis"
+    description = "Advanced spectral-temporal analysis for specific change detection"
     
     def detect_change(self, before_image, after_image, aoi_geometry, threshold=0.5):
         """
@@ -374,7 +560,7 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
         # Apply threshold
         change_mask = combined_score.gt(threshold)
         
-        return change_mask.rename('spectral_temporal_score')
+        return _skip_tiny_aoi(change_mask.rename('spectral_temporal_score'), aoi_geometry)
     
     def _extract_spectral_features(self, before_image, after_image):
         """Extract advanced spectral features"""
@@ -383,55 +569,55 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
         evi_after = self._calculate_evi(after_image)
         
         # Normalized Difference Built-up Index (NDBI)
-        ndbi_before = before_image.normalizedDifference(['B11', 'B8'])
-        ndbi_after = after_image.normalizedDifference(['B11', 'B8'])
+        ndbi_before = _with_indices(before_image).select('ndbi')
+        ndbi_after = _with_indices(after_image).select('ndbi')
         
         # Modified Normalized Difference Water Index (MNDWI)
-        mndwi_before = before_image.normalizedDifference(['B3', 'B11'])
-        mndwi_after = after_image.normalizedDifference(['B3', 'B11'])
+        mndwi_before = _with_indices(before_image).select('mndwi')
+        mndwi_after = _with_indices(after_image).select('mndwi')
         
         # Calculate spectral angle between before and after
         spectral_angle = self._calculate_spectral_angle(before_image, after_image)
         
-        # Combine spectral changes
-        spectral_change = ee.Image.cat([
-            evi_after.subtract(evi_before).abs(),
-            ndbi_after.subtract(ndbi_before).abs(),
-            mndwi_after.subtract(mndwi_before).abs(),
-            spectral_angle
-        ]).reduce(ee.Reducer.mean())
+        # Mean of the spectral changes, fused into one expression instead of cat + reduce
+        spectral_change = spectral_angle.expression(
+            '(abs(EVI_A - EVI_B) + abs(NDBI_A - NDBI_B) + abs(MNDWI_A - MNDWI_B) + ANGLE) / 4',
+            {
+                'EVI_A': evi_after,
+                'EVI_B': evi_before,
+                'NDBI_A': ndbi_after,
+                'NDBI_B': ndbi_before,
+                'MNDWI_A': mndwi_after,
+                'MNDWI_B': mndwi_before,
+                'ANGLE': spectral_angle
+            }
+        )
         
         return spectral_change
     
     def _calculate_evi(self, image):
         """Calculate Enhanced Vegetation Index"""
-        evi = image.expression(
-            '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))',
-            {
-                'NIR': image.select('B8'),
-                'RED': image.select('B4'),
-                'BLUE': image.select('B2')
-            }
-        )
-        return evi
+        return _with_indices(image).select('evi')
     
     def _calculate_spectral_angle(self, before_image, after_image):
         """Calculate spectral angle mapper (SAM)"""
-        # Select visible and NIR bands
-        bands = ['B2', 'B3', 'B4', 'B8']
-        before_spectrum = before_image.select(bands)
-        after_spectrum = after_image.select(bands)
-        
-        # Calculate dot product
-        dot_product = before_spectrum.multiply(after_spectrum).reduce(ee.Reducer.sum())
-        
-        # Calculate magnitudes
-        before_magnitude = before_spectrum.pow(2).reduce(ee.Reducer.sum()).sqrt()
-        after_magnitude = after_spectrum.pow(2).reduce(ee.Reducer.sum()).sqrt()
-        
-        # Calculate spectral angle
-        cos_angle = dot_product.divide(before_magnitude.multiply(after_magnitude))
-        spectral_angle = cos_angle.acos()
+        # Angle between the visible/NIR spectra as one fused expression; the epsilon
+        # avoids NaN where either spectrum has zero magnitude
+        spectral_angle = before_image.expression(
+            'acos((B2B * B2A + B3B * B3A + B4B * B4A + B8B * B8A) / '
+            '(sqrt(B2B * B2B + B3B * B3B + B4B * B4B + B8B * B8B) * '
+            'sqrt(B2A * B2A + B3A * B3A + B4A * B4A + B8A * B8A) + 1e-9))',
+            {
+                'B2B': before_image.select('B2'),
+                'B3B': before_image.select('B3'),
+                'B4B': before_image.select('B4'),
+                'B8B': before_image.select('B8'),
+                'B2A': after_image.select('B2'),
+                'B3A': after_image.select('B3'),
+                'B4A': after_image.select('B4'),
+                'B8A': after_image.select('B8')
+            }
+        )
         
         return spectral_angle
     
@@ -442,23 +628,19 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
             ee.Date(before_image.get('system:time_start')), 'day'
         )
         
-        # Calculate gradients for key bands
+        # Calculate gradients for key bands in one band-wise operation
         bands = ['B4', 'B8', 'B11']
-        gradients = []
-        
-        for band in bands:
-            gradient = after_image.select(band).subtract(before_image.select(band)).divide(time_diff)
-            gradients.append(gradient)
+        gradients = after_image.select(bands).subtract(before_image.select(bands)).divide(time_diff)
         
-        temporal_gradient = ee.Image.cat(gradients).reduce(ee.Reducer.mean()).abs()
+        temporal_gradient = gradients.reduce(_reducer('mean')).abs()
         
         return temporal_gradient
     
     def _analyze_phenological_changes(self, before_image, after_image):
         """Analyze phenological changes for vegetation monitoring"""
         # Calculate vegetation indices
-        ndvi_before = before_image.normalizedDifference(['B8', 'B4'])
-        ndvi_after = after_image.normalizedDifference(['B8', 'B4'])
+        ndvi_before = _with_indices(before_image).select('ndvi')
+        ndvi_after = _with_indices(after_image).select('ndvi')
         
         # Green Chlorophyll Index
         gci_before = before_image.select('B8').divide(before_image.select('B3')).subtract(1)
@@ -468,12 +650,18 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
         rep_before = self._approximate_red_edge_position(before_image)
         rep_after = self._approximate_red_edge_position(after_image)
         
-        # Phenological change score
-        phenology_change = ee.Image.cat([
-            ndvi_after.subtract(ndvi_before).abs(),
-            gci_after.subtract(gci_before).abs(),
-            rep_after.subtract(rep_before).abs()
-        ]).reduce(ee.Reducer.mean())
+        # Phenological change score: mean absolute change, as a single expression
+        phenology_change = ndvi_after.expression(
+            '(abs(NDVI_A - NDVI_B) + abs(GCI_A - GCI_B) + abs(REP_A - REP_B)) / 3',
+            {
+                'NDVI_A': ndvi_after,
+                'NDVI_B': ndvi_before,
+                'GCI_A': gci_after,
+                'GCI_B': gci_before,
+                'REP_A': rep_after,
+                'REP_B': rep_before
+            }
+        )
         
         return phenology_change
     
@@ -489,20 +677,46 @@ class SpectralTemporalAnalysis(BaseAlgorithm):
     
     def _combine_features(self, spectral_features, temporal_gradients, phenology_changes):
         """Combine all features into final change score"""
-        # Weighted combination
-        weights = ee.Image([0.4, 0.3, 0.3])  # spectral, temporal, phenological
-        
-        combined_features = ee.Image.cat([
-            spectral_features,
-            temporal_gradients,
-            phenology_changes
-        ])
-        
-        combined_score = combined_features.multiply(weights).reduce(ee.Reducer.sum())
+        # Weighted combination of spectral, temporal and phenological features
+        combined_score = spectral_features.expression(
+            '0.4 * SPECTRAL + 0.3 * TEMPORAL + 0.3 * PHENOLOGY',
+            {
+                'SPECTRAL': spectral_features,
+                'TEMPORAL': temporal_gradients,
+                'PHENOLOGY': phenology_changes
+            }
+        )
         
         return combined_score
 
 
+ADVANCED_ALGORITHMS = (
+    TransformerChangeDetection,
+    TemporalConsistencyDetection,
+    MultiSensorFusionDetection,
+    SpectralTemporalAnalysis
+)
+
+
+def run_ensemble(before_image, after_image, aoi_geometry, threshold=0.5,
+                 algorithm_classes=ADVANCED_ALGORITHMS):
+    """
+    Run several algorithms on the same image pair.
+    
+    detect_change only builds lazy EE graphs (no requests are made until the
+    caller evaluates or exports a mask), so the algorithms are simply run in
+    turn. Shared feature extraction is memoized per image, so it is only built
+    once across the ensemble.
+    
+    Returns:
+        Dictionary mapping each algorithm's name to its change mask
+    """
+    return {
+        algorithm.name: algorithm.detect_change(before_image, after_image, aoi_geometry, threshold)
+        for algorithm in (algorithm_class() for algorithm_class in algorithm_classes)
+    }
+
+
 # Register the new advanced algorithms
 def register_advanced_algorithms(algorithm_registry):
     """Register all advanced algorithms"""
@@ -5,9 +5,34 @@ This module implements a state-of-the-art algorithm for detecting deforestation
 with advanced false positive reduction for crop harvesting and natural vegetation changes.
 """
 
+import bisect
 import ee
+import functools
+import hashlib
+import logging
+import numpy as np
 import sys
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+
+# Numba is optional; it only accelerates index math on locally held NumPy tiles
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Shapely is optional; it lets client-side AOIs skip the server centroid
+try:
+    from shapely.geometry import shape as shapely_shape
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
 
 # Add the parent directory to the path to enable imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,6 +49,293 @@ except ImportError:
     spec.loader.exec_module(change_detection_system)
     ChangeDetectionAlgorithm = change_detection_system.ChangeDetectionAlgorithm
 
+logger = logging.getLogger(__name__)
+
+# Seasonal periods for the Indian subcontinent, based on Jeganathan et al. (2014), Roy et al. (2002)
+MONSOON_MONTHS = frozenset({6, 7, 8, 9})        # June-September (SW monsoon)
+POST_MONSOON_MONTHS = frozenset({10, 11})       # October-November (post-monsoon)
+WINTER_MONTHS = frozenset({12, 1, 2})           # December-February (winter/dry)
+PRE_MONSOON_MONTHS = frozenset({3, 4, 5})       # March-May (pre-monsoon/dry)
+
+# Seasonal-factor floors by mean score: <= 0.4 none, (0.4, 0.6] light, > 0.6 minimal filtering
+SIGNAL_MEAN_THRESHOLDS = (0.4, 0.6)
+SIGNAL_FACTOR_FLOORS = (0.0, 0.90, 0.95)
+
+# (before_month, after_month) transitions with the strongest phenological swing
+EXTREME_SEASONAL_COMBOS = frozenset({
+    (2, 7), (3, 8), (4, 9),     # Late dry to peak wet
+    (1, 6), (12, 7), (11, 8)    # Winter to monsoon
+})
+
+
+class SensitivityLevel(IntEnum):
+    """User detection sensitivity; indexes SENSITIVITY_MULTIPLIERS"""
+    CONSERVATIVE = 0
+    BALANCED = 1
+    HIGH = 2
+
+
+class FalsePositiveTolerance(IntEnum):
+    """User false-positive tolerance; indexes FP_TOLERANCE_FACTORS"""
+    LOW = 0
+    MODERATE = 1
+    HIGH = 2
+
+
+SENSITIVITY_MULTIPLIERS = (0.7, 1.0, 1.3)
+FP_TOLERANCE_FACTORS = (0.6, 0.75, 0.9)     # low = aggressive filtering, high = light filtering
+
+# Frontend preference strings -> codes (unrecognised values fall back to the defaults)
+_SENSITIVITY_CODES = {level.name.lower(): level for level in SensitivityLevel}
+_FP_TOLERANCE_CODES = {tolerance.name.lower(): tolerance for tolerance in FalsePositiveTolerance}
+
+
+class RegionType(IntEnum):
+    """Geographic region of an AOI centroid; indexes REGION_CLIMATE_FACTORS"""
+    OTHER = 0
+    HIMALAYAN = 1
+    TROPICAL = 2
+    SUBTROPICAL = 3
+
+
+# More conservative in mountains, more sensitive in tropics
+REGION_CLIMATE_FACTORS = np.array([1.0, 0.9, 1.1, 1.0])
+
+
+def _build_region_map():
+    """
+    (lat, lon) grid of RegionType codes on half-degree slots: slot 2k holds the exact
+    integer degree k and slot 2k + 1 the open interval (k, k + 1). Every region bound is
+    an integer, so classifying each slot at its representative point (k or k + 0.5)
+    reproduces the inclusive/exclusive comparisons exactly, boundaries included.
+    """
+    latitude = (np.arange(-180, 181) / 2.0)[:, None]
+    longitude = (np.arange(-360, 361) / 2.0)[None, :]
+    india = (6 <= latitude) & (latitude <= 37) & (68 <= longitude) & (longitude <= 97)  # India bounds
+    
+    region_map = np.full((361, 721), RegionType.OTHER, dtype=np.int8)
+    region_map[india & (latitude > 30)] = RegionType.HIMALAYAN
+    region_map[india & (latitude < 15)] = RegionType.TROPICAL
+    region_map[india & (15 <= latitude) & (latitude <= 30)] = RegionType.SUBTROPICAL
+    return region_map
+
+
+REGION_MAP = _build_region_map()
+
+
+def _half_degree_slots(degrees, offset, last):
+    """REGION_MAP index along one axis: 2 * floor(x), plus 1 when x is not a whole degree"""
+    degrees = np.asarray(degrees, dtype=np.float64)
+    whole = np.floor(degrees)
+    slots = 2 * whole.astype(np.intp) + (degrees > whole) + offset
+    return np.clip(slots, 0, last)
+
+
+def _region_codes(latitudes, longitudes):
+    """RegionType codes for scalar or array centroids, via one REGION_MAP lookup"""
+    return REGION_MAP[_half_degree_slots(latitudes, 180, 360), _half_degree_slots(longitudes, 360, 720)]
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries also expire ttl seconds after being stored"""
+    
+    def __init__(self, max_size=500, ttl=30 * 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+# Evaluated adaptive-analysis statistics, shared by all detector instances and keyed
+# by a digest of the serialized before/after/AOI graphs
+_analysis_stats_cache = _TTLCache()
+# Evaluated month-aware score statistics, keyed by a digest of the serialized score and AOI
+_score_stats_cache = _TTLCache()
+
+
+@functools.lru_cache(maxsize=None)
+def _kernel(shape, radius):
+    """
+    Shared ee.Kernel.square/circle instance (pixel units, normalized).
+    
+    Built on first use rather than at import, since ee.Kernel's constructors are
+    only available once the Earth Engine API has been initialized.
+    """
+    return getattr(ee.Kernel, shape)(radius=radius)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _vegetation_indices_kernel(nir, red, blue, swir1, swir2):
+        """NDVI, EVI, NDMI and NBR stacked as (4, rows, cols), rows in parallel"""
+        out = np.zeros((4,) + nir.shape, np.float32)
+        for i in numba.prange(nir.shape[0]):
+            for j in range(nir.shape[1]):
+                n = nir[i, j]
+                r = red[i, j]
+                # Zero denominators give 0, matching Earth Engine's divide
+                d = n + r
+                if d != 0:
+                    out[0, i, j] = (n - r) / d
+                d = n + 6 * r - 7.5 * blue[i, j] + 1
+                if d != 0:
+                    out[1, i, j] = 2.5 * (n - r) / d
+                d = n + swir1[i, j]
+                if d != 0:
+                    out[2, i, j] = (n - swir1[i, j]) / d
+                d = n + swir2[i, j]
+                if d != 0:
+                    out[3, i, j] = (n - swir2[i, j]) / d
+        return out
+else:
+    def _vegetation_indices_kernel(nir, red, blue, swir1, swir2):
+        """NDVI, EVI, NDMI and NBR stacked as (4, rows, cols)"""
+        def ratio(num, den):
+            return np.divide(num, den, out=np.zeros_like(num), where=den != 0)
+        return np.stack([
+            ratio(nir - red, nir + red),
+            ratio(2.5 * (nir - red), nir + 6 * red - 7.5 * blue + 1),
+            ratio(nir - swir1, nir + swir1),
+            ratio(nir - swir2, nir + swir2)
+        ])
+
+
+def _primary_score_numpy(before, after, vegetation_threshold, sensitivity_multiplier):
+    """
+    NumPy counterpart of the fused primary-score expression.
+    
+    before/after are (4, rows, cols) NDVI/EVI/NDMI/NBR stacks; returns a float32
+    (rows, cols) score. Divisions by zero give 0, as in Earth Engine.
+    """
+    vt = vegetation_threshold
+    m = sensitivity_multiplier
+    ndvi_b, evi_b, _, nbr_b = before
+    ndvi_d, evi_d, ndmi_d, nbr_d = before - after
+    
+    ndvi_decrease = np.clip(ndvi_d, 0, 1)
+    relative_denominator = ndvi_b + 0.01
+    relative_change = np.divide(ndvi_d, relative_denominator, out=np.zeros_like(ndvi_d),
+                                where=relative_denominator != 0)
+    primary = (0.4 * np.minimum(ndvi_decrease * 1.8 * m, 1)
+               + 0.3 * np.minimum(np.clip(relative_change, 0, 1) * 1.4 * m, 1)
+               + 0.3 * np.clip(nbr_d * 1.7 * m, 0, 1))
+    consistency = (ndvi_d > 0.05) & (evi_d > 0.03) & ((ndmi_d > -0.1) | (nbr_d > 0.03))
+    
+    negative_ndvi = ndvi_b < 0.05
+    low_ndvi = ndvi_b < vt * 0.3
+    degraded = (((ndvi_b > -0.5) & negative_ndvi & ((evi_d > 0.008) | (nbr_d > 0.015)))
+                | ((evi_b > 0.03) & (evi_d > 0.008) & (ndvi_b < 0.1))
+                | ((nbr_b > -0.1) & (nbr_d > 0.015) & (ndvi_b < 0.15)))
+    decreased = ~negative_ndvi & (ndvi_d > 0)
+    dense = decreased & (ndvi_b > vt * 1.5)
+    moderate = decreased & (ndvi_b > vt) & (ndvi_b <= vt * 1.5)
+    standard_sparse = ~negative_ndvi & (ndvi_b > vt * 0.5) & (ndvi_b <= vt) & (ndvi_d > 0.05)
+    sparse = standard_sparse | degraded
+    
+    # Weighted multi-index consensus accumulated in place to avoid full-size temporaries
+    consensus = np.clip(evi_d * (5.0 * m), 0, 1)
+    consensus *= 0.4
+    consensus += 0.3 * np.clip(ndmi_d * (4.5 * m), 0, 1)
+    consensus += 0.3 * np.clip(nbr_d * (4.8 * m), 0, 1)
+    fallback = ~(dense | moderate | sparse) & (ndvi_d > 0.08) & (evi_d > 0.05) & (ndvi_b > 0.05)
+    
+    return np.maximum.reduce([
+        np.where(dense & consistency, 0.8 * primary, 0),
+        np.where(moderate, 0.9 * primary, 0),
+        np.where(sparse & ~negative_ndvi, np.minimum(ndvi_decrease * 2.0 * m, 1), 0),
+        np.where(sparse & (negative_ndvi | low_ndvi), consensus, 0),
+        np.where(fallback, np.minimum(ndvi_decrease * 1.2, 0.3), 0)
+    ]).astype(np.float32, copy=False)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _primary_score_kernel(before, after, vegetation_threshold, sensitivity_multiplier):
+        """Scalar form of _primary_score_numpy, one row strip per thread"""
+        vt = np.float32(vegetation_threshold)
+        m = np.float32(sensitivity_multiplier)
+        rows, cols = before.shape[1], before.shape[2]
+        out = np.zeros((rows, cols), np.float32)
+        for i in numba.prange(rows):
+            for j in range(cols):
+                ndvi_b = before[0, i, j]
+                evi_b = before[1, i, j]
+                nbr_b = before[3, i, j]
+                ndvi_d = ndvi_b - after[0, i, j]
+                evi_d = evi_b - after[1, i, j]
+                ndmi_d = before[2, i, j] - after[2, i, j]
+                nbr_d = nbr_b - after[3, i, j]
+                
+                ndvi_decrease = min(max(ndvi_d, 0.0), 1.0)
+                negative_ndvi = ndvi_b < 0.05
+                degraded = ((ndvi_b > -0.5 and negative_ndvi and (evi_d > 0.008 or nbr_d > 0.015))
+                            or (evi_b > 0.03 and evi_d > 0.008 and ndvi_b < 0.1)
+                            or (nbr_b > -0.1 and nbr_d > 0.015 and ndvi_b < 0.15))
+                
+                score = 0.0
+                if not negative_ndvi and ndvi_d > 0 and ndvi_b > vt:
+                    denominator = ndvi_b + 0.01
+                    relative_change = ndvi_d / denominator if denominator != 0 else 0.0
+                    primary = (0.4 * min(ndvi_decrease * 1.8 * m, 1.0)
+                               + 0.3 * min(min(max(relative_change, 0.0), 1.0) * 1.4 * m, 1.0)
+                               + 0.3 * min(max(nbr_d * 1.7 * m, 0.0), 1.0))
+                    if ndvi_b > vt * 1.5:
+                        consistent = (ndvi_d > 0.05 and evi_d > 0.03
+                                      and (ndmi_d > -0.1 or nbr_d > 0.03))
+                        score = 0.8 * primary if consistent else 0.0
+                    else:
+                        score = 0.9 * primary
+                
+                if degraded:
+                    if not negative_ndvi:
+                        score = max(score, min(ndvi_decrease * 2.0 * m, 1.0))
+                    if negative_ndvi or ndvi_b < vt * 0.3:
+                        consensus = (0.4 * min(max(evi_d * 5.0 * m, 0.0), 1.0)
+                                     + 0.3 * min(max(ndmi_d * 4.5 * m, 0.0), 1.0)
+                                     + 0.3 * min(max(nbr_d * 4.8 * m, 0.0), 1.0))
+                        score = max(score, consensus)
+                elif not negative_ndvi and ndvi_b > vt * 0.5 and ndvi_b <= vt and ndvi_d > 0.05:
+                    score = max(score, min(ndvi_decrease * 2.0 * m, 1.0))
+                elif ndvi_b > 0.05 and ndvi_b <= vt and ndvi_d > 0.08 and evi_d > 0.05:
+                    score = min(ndvi_decrease * 1.2, 0.3)
+                out[i, j] = score
+        return out
+else:
+    _primary_score_kernel = _primary_score_numpy
+
+
+@dataclass
+class DetectionResult:
+    """Lazy EE components of one detection, before they are concatenated into a change image"""
+    indices_before: ee.Image
+    indices_after: ee.Image
+    primary_score: ee.Image
+    filtered_score: ee.Image
+    thresholded_change: ee.Image
+    rgb_before: ee.Image
+    rgb_after: ee.Image
+    has_rgb_bands: ee.ComputedObject
+
+
 class DeforestationDetection(ChangeDetectionAlgorithm):
     """
     ADAPTIVE deforestation detection with intelligent data analysis.
@@ -35,13 +347,41 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
     - Temporal context (season, data quality)
     """
     
-    def __init__(self, user_preferences=None):
+    # Logical band roles of the harmonized Sentinel-2 band set
+    _HARMONIZED_BAND_MAP = {
+        'BLUE': 'B2',
+        'GREEN': 'B3',
+        'RED': 'B4',
+        'NIR': 'B8',
+        'SWIR1': 'B11',
+        'SWIR2': 'B12'
+    }
+    
+    # Scale of int16-quantized index stacks (the Sentinel-2 reflectance convention)
+    _INDEX_SCALE = 10000
+    
+    def __init__(self, user_preferences=None, debug=False, band_map=None):
         """Initialize with user preferences for adaptive behavior"""
         super().__init__()
         
+        # Band role -> band name for the input imagery, resolved once per dataset by the
+        # caller (defaults to the harmonized Sentinel-2 names)
+        self.band_map = {**self._HARMONIZED_BAND_MAP, **(band_map or {})}
+        
         # User configurable parameters from frontend
         self.user_preferences = user_preferences or {}
         
+        # Diagnostics (centre-pixel samples, range probes) cost a blocking getInfo
+        # round-trip, so they are only fetched when requested here or when this
+        # module's logger is enabled for DEBUG
+        self.debug = debug
+        
+        # Vegetation index graphs keyed by a digest of the serialized source image and
+        # band map, so the same image is only turned into an index stack once
+        self._indices_cache = _TTLCache(max_size=128)
+        # Baseline masks keyed the same way by the before-index stack's digest
+        self._baseline_cache = _TTLCache(max_size=128)
+        
         # Adaptive parameters that will be calculated from data
         self.adaptive_params = {
             'vegetation_thresholds': {},
@@ -50,696 +390,516 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             'confidence_levels': {}
         }
     
-    def detect_change(self, before_image, after_image, aoi_geometry):
+    def detect_change(self, before_image, after_image, aoi_geometry, adaptive_params=None):
+        """
+        🧠 INTELLIGENT ADAPTIVE deforestation detection.
+        
+        Returns the detection components concatenated into a single change image
+        (see _detect_change_components).
+        """
+        components = self._detect_change_components(before_image, after_image, aoi_geometry, adaptive_params)
+        change_image = self._change_image(components)
+        logger.info("Deforestation detection completed")
+        return change_image
+    
+    def _change_image(self, components, deforestation_score=None, extra_bands=()):
+        """
+        Concatenate detection components into the change image.
+        
+        deforestation_score overrides the primary score band, and extra_bands are
+        appended after the thresholded change band. Whether both images carry RGB is decided
+        server-side so no band probe round-trip is needed.
+        """
+        if deforestation_score is None:
+            deforestation_score = components.primary_score
+        
+        base_bands = [
+            components.indices_before,
+            components.indices_after,
+            deforestation_score.rename('deforestation_score'),
+            components.filtered_score.rename('filtered_deforestation_score'),
+            components.thresholded_change
+        ] + list(extra_bands)
+        
+        return ee.Image(ee.Algorithms.If(
+            components.has_rgb_bands,
+            ee.Image.cat(base_bands + [components.rgb_before, components.rgb_after]),
+            ee.Image.cat(base_bands)
+        ))
+    
+    def _detect_change_components(self, before_image, after_image, aoi_geometry, adaptive_params=None):
         """
         🧠 INTELLIGENT ADAPTIVE deforestation detection.
         
         This method:
-        1. Analyzes input data characteristics
+        1. Analyzes input data characteristics (unless adaptive_params is given)
         2. Adapts parameters based on data and user preferences  
         3. Applies optimized detection algorithms
-        4. Returns results with confidence metrics
+        4. Returns the lazy result components as a DetectionResult
         """
-        print("🚀 Starting ADAPTIVE deforestation detection with intelligent data analysis...")
+        logger.info("🚀 Starting ADAPTIVE deforestation detection with intelligent data analysis...")
         
         # STEP 1: ANALYZE DATA CHARACTERISTICS AND ADAPT PARAMETERS
-        print("📊 STEP 1: Analyzing data characteristics...")
-        adaptive_params = self.analyze_data_characteristics(before_image, after_image, aoi_geometry)
+        if adaptive_params is None:
+            logger.info("📊 STEP 1: Analyzing data characteristics...")
+            adaptive_params = self.analyze_data_characteristics(before_image, after_image, aoi_geometry)
         
         # Store adaptive parameters for use throughout detection
         self.adaptive_params = adaptive_params
         
-        print(f"🎯 ADAPTIVE PARAMETERS:")
-        print(f"   🌿 Vegetation threshold: {adaptive_params['vegetation_threshold']:.3f}")
-        print(f"   📈 Sensitivity multiplier: {adaptive_params['sensitivity_multiplier']:.3f}")
-        print(f"   🚫 False positive factor: {adaptive_params['false_positive_factor']:.3f}")
-        print(f"   ✅ Confidence level: {adaptive_params['confidence_level']:.3f}")
+        logger.debug("🎯 ADAPTIVE PARAMETERS:")
+        logger.debug("   🌿 Vegetation threshold: %.3f", adaptive_params['vegetation_threshold'])
+        logger.debug("   📈 Sensitivity multiplier: %.3f", adaptive_params['sensitivity_multiplier'])
+        logger.debug("   🚫 False positive factor: %.3f", adaptive_params['false_positive_factor'])
+        logger.debug("   ✅ Confidence level: %.3f", adaptive_params['confidence_level'])
         
         # STEP 2: PROCEED WITH ADAPTIVE DETECTION
-        print("🔍 STEP 2: Applying adaptive detection algorithm...")
+        logger.info("🔍 STEP 2: Applying adaptive detection algorithm...")
         
         # First ensure we only work with the harmonized bands
         harmonized_bands = ['B2', 'B3', 'B4', 'B8', 'B11', 'B12']
         
-        try:
-            # Check available bands to validate harmonization
-            before_bands = before_image.bandNames().getInfo()
-            after_bands = after_image.bandNames().getInfo()
-            
-            print(f"Before image available bands: {before_bands}")
-            print(f"After image available bands: {after_bands}")
-            
-            # Check if images are properly harmonized
-            missing_before = [b for b in harmonized_bands if b not in before_bands]
-            missing_after = [b for b in harmonized_bands if b not in after_bands]
-            
-            if missing_before or missing_after:
-                print(f"WARNING: Missing bands in before image: {missing_before}")
-                print(f"WARNING: Missing bands in after image: {missing_after}")
-                print("Proceeding with available bands only")
-        except Exception as e:
-            print(f"WARNING: Could not check bands: {e}")
-        
         # Calculate multiple vegetation indices for robust analysis
         before_indices = self._calculate_vegetation_indices(before_image)
         after_indices = self._calculate_vegetation_indices(after_image)
         
-        print("Calculated vegetation indices")
-        
-        # Sample some values for debugging - with error handling for band mismatches
-        try:
-            sample_point = aoi_geometry.centroid()
-            before_sample = before_indices.sample(sample_point, 30).first().getInfo()
-            after_sample = after_indices.sample(sample_point, 30).first().getInfo()
-            print(f"Before indices at center: {before_sample}")
-            print(f"After indices at center: {after_sample}")
-        except Exception as e:
-            print(f"Could not sample indices: {e}")
-            # Continue processing despite sampling error
+        logger.debug("Calculated vegetation indices")
         
         # Rename indices to match expected naming convention
-        before_indices_renamed = ee.Image.cat([
-            before_indices.select('NDVI').rename('NDVI_before'),
-            before_indices.select('EVI').rename('EVI_before'),
-            before_indices.select('SAVI').rename('SAVI_before'),
-            before_indices.select('NDMI').rename('NDMI_before'),
-            before_indices.select('NBR').rename('NBR_before')
-        ])
-        
-        after_indices_renamed = ee.Image.cat([
-            after_indices.select('NDVI').rename('NDVI_after'),
-            after_indices.select('EVI').rename('EVI_after'),
-            after_indices.select('SAVI').rename('SAVI_after'),
-            after_indices.select('NDMI').rename('NDMI_after'),
-            after_indices.select('NBR').rename('NBR_after')
-        ])
+        before_indices_renamed = before_indices.rename(['NDVI_before', 'EVI_before', 'NDMI_before', 'NBR_before'])
+        after_indices_renamed = after_indices.rename(['NDVI_after', 'EVI_after', 'NDMI_after', 'NBR_after'])
         
         # Primary deforestation detection using multiple indices
         deforestation_score = self._calculate_primary_score(before_indices, after_indices)
-        print("Calculated primary deforestation score")
+        logger.debug("Calculated primary deforestation score")
         
         # Apply seasonal change filtering first
         seasonal_filtered_score = self._apply_seasonal_filtering(
             deforestation_score, before_indices, after_indices, aoi_geometry
         )
-        print("Applied seasonal filtering")
+        logger.debug("Applied seasonal filtering")
         
         # Apply advanced false positive filtering
         filtered_score = self._apply_false_positive_filters(
             seasonal_filtered_score, before_indices, after_indices, aoi_geometry
         )
-        print("Applied false positive filters")
+        logger.debug("Applied false positive filters")
         
-        # Sample the scores for debugging - with error handling for band mismatches
-        try:
-            score_sample = deforestation_score.sample(sample_point, 30).first().getInfo()
-            filtered_sample = filtered_score.sample(sample_point, 30).first().getInfo()
-            print(f"Primary score at center: {score_sample}")
-            print(f"Filtered score at center: {filtered_sample}")
-        except Exception as e:
-            print(f"Could not sample scores: {e}")
-            # Continue processing despite sampling error
-        
-        # RESEARCH IMPROVEMENT: Dynamic thresholding based on adaptive parameters
-        # More sensitive threshold based on vegetation analysis
-        adaptive_params = getattr(self, 'adaptive_params', self._get_fallback_parameters())
-        vegetation_threshold = adaptive_params.get('vegetation_threshold', 0.12)
-        
-        # Calculate dynamic threshold based on vegetation characteristics
+        # RESEARCH IMPROVEMENT: Dynamic thresholding based on vegetation density
         # Dense forests: higher threshold to reduce false positives
         # Sparse vegetation: lower threshold to maintain sensitivity
-        if hasattr(self, 'adaptive_params'):
-            analysis_summary = adaptive_params.get('analysis_summary', {})
-            vegetation_type = analysis_summary.get('vegetation_type', 'unknown')
-            
-            if 'dense' in vegetation_type:
-                detection_threshold = 0.12  # Conservative for dense forests
-            elif 'sparse' in vegetation_type or 'dry' in vegetation_type:
-                detection_threshold = 0.06  # Sensitive for sparse/dry areas
-            else:
-                detection_threshold = 0.08  # Balanced for moderate vegetation
-        else:
-            detection_threshold = 0.08  # Default balanced threshold
+        # Chosen per pixel from the before-NDVI, using the same density breakpoints as
+        # _analyze_vegetation_distribution (dense_forest > 0.65, sparse classes <= 0.3)
+        ndvi_before = before_indices.select('NDVI')
+        detection_threshold = ee.Image.constant(0.08).where(
+            ndvi_before.gt(0.65), 0.12  # Conservative for dense forests
+        ).where(
+            ndvi_before.lte(0.3), 0.06  # Sensitive for sparse/dry areas
+        )
         
-        print(f"🎯 Using dynamic detection threshold: {detection_threshold:.3f}")
         thresholded_change = filtered_score.gte(detection_threshold).rename('thresholded_change')
         
-        # Debug: Sample the threshold result
-        try:
-            threshold_sample = thresholded_change.sample(sample_point, 30).first().getInfo()
-            print(f"Threshold result at center: {threshold_sample}")
-        except Exception as e:
-            print(f"Could not sample threshold: {e}")
-        
-        # Create change image with original bands
-        try:
-            # Use a more robust approach to check if RGB bands exist first
-            has_rgb_bands = True
-            for band in ['B4', 'B3', 'B2']:
-                try:
-                    # This will throw an error if any band is missing
-                    before_image.select([band]).getInfo()
-                    after_image.select([band]).getInfo()
-                except:
-                    has_rgb_bands = False
-                    break
-            
-            if has_rgb_bands:
-                print("Adding RGB bands to change image...")
-                before_rgb = before_image.select(['B4', 'B3', 'B2']).rename(['B4_before', 'B3_before', 'B2_before'])
-                after_rgb = after_image.select(['B4', 'B3', 'B2']).rename(['B4_after', 'B3_after', 'B2_after'])
-                
-                change_image = ee.Image.cat([
-                    before_indices_renamed,
-                    after_indices_renamed,
-                    deforestation_score.rename('deforestation_score'),
-                    filtered_score.rename('filtered_deforestation_score'),
-                    thresholded_change,
-                    before_rgb,
-                    after_rgb
-                ])
-            else:
-                print("RGB bands not available, excluding from change image...")
-                change_image = ee.Image.cat([
-                    before_indices_renamed,
-                    after_indices_renamed,
-                    deforestation_score.rename('deforestation_score'),
-                    filtered_score.rename('filtered_deforestation_score'),
-                    thresholded_change
-                ])
-        except Exception as e:
-            print(f"WARNING: Error adding RGB bands to change image: {e}")
-            # Fallback without RGB bands
-            change_image = ee.Image.cat([
-                before_indices_renamed,
-                after_indices_renamed,
-                deforestation_score.rename('deforestation_score'),
-                filtered_score.rename('filtered_deforestation_score'),
-                thresholded_change
-            ])
-        
-        print("Deforestation detection completed")
-        return change_image
+        # Debug: Sample every intermediate at the AOI centre in a single round-trip
+        if self._debug_enabled():
+            try:
+                sample_point = aoi_geometry.centroid()
+                samples = ee.Dictionary({
+                    'before_harmonized': ee.List(before_image.bandNames()).containsAll(harmonized_bands),
+                    'after_harmonized': ee.List(after_image.bandNames()).containsAll(harmonized_bands),
+                    'before_sample': before_indices.sample(sample_point, 30).first(),
+                    'after_sample': after_indices.sample(sample_point, 30).first(),
+                    'score_sample': deforestation_score.sample(sample_point, 30).first(),
+                    'filtered_sample': filtered_score.sample(sample_point, 30).first(),
+                    'threshold_sample': thresholded_change.sample(sample_point, 30).first()
+                }).getInfo()
+                if not (samples.get('before_harmonized') and samples.get('after_harmonized')):
+                    logger.warning("Images are missing harmonized bands %s, proceeding with available bands only",
+                                   harmonized_bands)
+                logger.debug("Before indices at center: %s", samples.get('before_sample'))
+                logger.debug("After indices at center: %s", samples.get('after_sample'))
+                logger.debug("Primary score at center: %s", samples.get('score_sample'))
+                logger.debug("Filtered score at center: %s", samples.get('filtered_sample'))
+                logger.debug("Threshold result at center: %s", samples.get('threshold_sample'))
+            except Exception as e:
+                logger.debug("Could not sample debug values: %s", e)
+        
+        rgb_bands = ['B4', 'B3', 'B2']
+        return DetectionResult(
+            indices_before=before_indices_renamed,
+            indices_after=after_indices_renamed,
+            primary_score=deforestation_score,
+            filtered_score=filtered_score,
+            thresholded_change=thresholded_change,
+            rgb_before=before_image.select(rgb_bands).rename(['B4_before', 'B3_before', 'B2_before']),
+            rgb_after=after_image.select(rgb_bands).rename(['B4_after', 'B3_after', 'B2_after']),
+            has_rgb_bands=ee.List(before_image.bandNames()).containsAll(rgb_bands).And(
+                ee.List(after_image.bandNames()).containsAll(rgb_bands)
+            )
+        )
     
     def detect_change_with_dates(self, before_image, after_image, aoi_geometry, before_period, after_period):
         """
         Enhanced deforestation detection with seasonal awareness using date information.
         Includes robust band handling for harmonized bands.
         """
-        print("Starting seasonal-aware deforestation detection with harmonized bands...")
+        logger.info("Starting seasonal-aware deforestation detection with harmonized bands...")
         
-        # First run the standard detection with the harmonized bands
-        change_image = self.detect_change(before_image, after_image, aoi_geometry)
-        
-        # Check available bands and extract the appropriate score with thorough error handling
-        try:
-            # First try getting the band names directly
-            try:
-                available_bands = change_image.bandNames().getInfo()
-                print(f"Available bands in change image: {available_bands}")
-            except Exception as e:
-                print(f"WARNING: Could not retrieve band names: {e}")
-                # Continue anyway, we'll try to select specific bands
-            
-            # Try to get the filtered score, fall back to main score if needed
-            deforestation_score = None
-            
-            # First try filtered_deforestation_score
-            try:
-                deforestation_score = change_image.select('filtered_deforestation_score')
-                print("Using filtered_deforestation_score for seasonal adjustments")
-            except Exception as e:
-                print(f"Could not select filtered_deforestation_score: {e}")
-            
-            # If filtered score failed, try main score
-            if deforestation_score is None:
-                try:
-                    deforestation_score = change_image.select('deforestation_score')
-                    print("Using deforestation_score for seasonal adjustments")
-                except Exception as e:
-                    print(f"WARNING: Could not select deforestation_score: {e}")
-                    print("Skipping seasonal filtering - no score band available")
-                    return change_image
-                
-        except Exception as e:
-            print(f"WARNING: Error checking available bands: {e}")
-            # Try one last direct approach to get deforestation_score
-            try:
-                deforestation_score = change_image.select('deforestation_score')
-            except:
-                print("WARNING: Could not extract any score band, skipping seasonal filtering")
-                return change_image
+        # First run the standard detection with the harmonized bands, keeping the
+        # components separate so the filtered score is used directly
+        components = self._detect_change_components(before_image, after_image, aoi_geometry)
         
         # Apply month-aware seasonal filtering
-        seasonally_adjusted_score = None
         try:
             seasonally_adjusted_score = self._apply_month_aware_filtering(
-                deforestation_score, aoi_geometry, before_period, after_period
+                components.filtered_score.rename('filtered_deforestation_score'),
+                aoi_geometry, before_period, after_period
             )
-            print("Applied month-aware seasonal filtering")
-        except Exception as e:
-            print(f"WARNING: Seasonal adjustment failed: {e}")
-            return change_image
-            
-        # Only proceed if we have a valid seasonally adjusted score
-        if seasonally_adjusted_score is not None:
-            # Add the seasonally adjusted score as a new band (don't try to replace)
-            try:
-                updated_change_image = change_image.addBands(
-                    seasonally_adjusted_score.rename('seasonally_filtered_deforestation_score')
-                )
-                
-                # Try to update the main deforestation_score band for thresholding
-                try:
-                    updated_change_image = updated_change_image.addBands(
-                        seasonally_adjusted_score.rename('deforestation_score'), 
-                        ['deforestation_score'], 
-                        True
-                    )
-                except Exception as e:
-                    print(f"WARNING: Could not update main score band: {e}")
-                    # Just add as new band
-                    updated_change_image = updated_change_image.addBands(
-                        seasonally_adjusted_score.rename('final_deforestation_score')
-                    )
-                
-                print("Seasonal-aware deforestation detection completed")
-                return updated_change_image
-            except Exception as e:
-                print(f"WARNING: Could not add seasonal bands: {e}")
-                
-        # Fallback to original change image if anything failed
-        print("Using original change image without seasonal adjustment")
-        return change_image
-
-    def _calculate_vegetation_indices(self, image):
-        """Calculate multiple vegetation indices for robust analysis with harmonized bands only"""
-        print("DEBUG: Calculating vegetation indices with harmonized bands...")
-        
-        # Check available bands first to avoid errors
-        try:
-            available_bands = image.bandNames().getInfo()
-            print(f"Available bands for index calculation: {available_bands}")
+            logger.debug("Applied month-aware seasonal filtering")
         except Exception as e:
-            print(f"WARNING: Could not check available bands: {e}")
-            available_bands = []
-        
-        # Define band mappings for robust index calculation
-        # Use the harmonized band names that should be available
-        band_map = {}
-        for band in available_bands:
-            if 'B2' in band or 'blue' in band.lower():
-                band_map['BLUE'] = band
-            elif 'B3' in band or 'green' in band.lower():
-                band_map['GREEN'] = band
-            elif 'B4' in band or 'red' in band.lower():
-                band_map['RED'] = band
-            elif 'B8' in band or 'nir' in band.lower():
-                band_map['NIR'] = band
-            elif 'B11' in band or 'swir1' in band.lower():
-                band_map['SWIR1'] = band
-            elif 'B12' in band or 'swir2' in band.lower():
-                band_map['SWIR2'] = band
-        
-        print(f"DEBUG: Band mapping: {band_map}")
-        
-        # Get basic statistics to check if we have real data - Fixed geometry issue
-        try:
-            # Create a sample geometry for statistics (small buffer around image center)
-            image_bounds = image.geometry()
-            sample_point = image_bounds.centroid()
-            sample_region = sample_point.buffer(1000)  # 1km buffer
-            
-            # Sample a few pixels to check if we have real data vs constants
-            # Use available bands for sampling
-            sample_bands = available_bands[:2] if len(available_bands) >= 2 else available_bands
-            if sample_bands:
-                sample_stats = image.select(sample_bands).reduceRegion(
-                    reducer=ee.Reducer.minMax(),
-                    geometry=sample_region,
-                    scale=100,
-                    maxPixels=1000
-                ).getInfo()
-                for band in sample_bands:
-                    print(f"DEBUG: Sample {band} range: {sample_stats.get(f'{band}_min', 'N/A')} to {sample_stats.get(f'{band}_max', 'N/A')}")
-            else:
-                print(f"DEBUG: No bands available for sampling")
-        except Exception as e:
-            print(f"DEBUG: Could not get sample statistics: {e}")
+            logger.warning("Seasonal adjustment failed: %s", e)
+            logger.info("Using original change image without seasonal adjustment")
+            return self._change_image(components)
+        
+        # The seasonally adjusted score is added as its own band and replaces
+        # deforestation_score for downstream thresholding
+        updated_change_image = self._change_image(
+            components,
+            deforestation_score=seasonally_adjusted_score,
+            extra_bands=[seasonally_adjusted_score.rename('seasonally_filtered_deforestation_score')]
+        )
         
+        logger.info("Seasonal-aware deforestation detection completed")
+        return updated_change_image
+
+    def _if_bands_available(self, image, band_map, roles, index_image, name):
+        """Server-side fallback to a zero band when the image lacks the index inputs"""
+        required_bands = [band_map[role] for role in roles]
+        return ee.Image(ee.Algorithms.If(
+            image.bandNames().containsAll(required_bands),
+            index_image.rename(name),
+            ee.Image.constant(0).rename(name)
+        ))
+    
+    def _debug_enabled(self):
+        """Whether diagnostic getInfo probes should run"""
+        return self.debug or logger.isEnabledFor(logging.DEBUG)
+    
+    def _fused_indices(self, image, band_map):
+        """NDVI, EVI, NDMI and NBR as a single fused image expression"""
+        x_bands = [band_map['RED'], band_map['RED'], band_map['SWIR1'], band_map['SWIR2']]
+        return image.expression(
+            'C * (NIR - X) / (NIR + K1 * X - K2 * BLUE + K3)', {
+                'NIR': image.select(band_map['NIR']),
+                'BLUE': image.select(band_map['BLUE']),
+                'X': image.select(x_bands, ['NDVI', 'EVI', 'NDMI', 'NBR']),
+                'C': ee.Image.constant([1, 2.5, 1, 1]),
+                'K1': ee.Image.constant([1, 6, 1, 1]),
+                'K2': ee.Image.constant([0, 7.5, 0, 0]),
+                'K3': ee.Image.constant([0, 1, 0, 0])
+            }
+        ).rename(['NDVI', 'EVI', 'NDMI', 'NBR'])
+    
+    def _per_index_indices(self, image, band_map):
+        """Index-by-index calculation, zero-filling any index whose inputs are missing"""
         # NDVI - Standard vegetation index
-        try:
-            if 'NIR' in band_map and 'RED' in band_map:
-                ndvi = image.normalizedDifference([band_map['NIR'], band_map['RED']]).rename('NDVI')
-                print("DEBUG: NDVI calculation successful")
-            else:
-                print(f"WARNING: Cannot calculate NDVI - missing bands. Available: {list(band_map.keys())}")
-                ndvi = ee.Image.constant(0).rename('NDVI')
-        except Exception as e:
-            print(f"WARNING: Could not calculate NDVI: {e}")
-            ndvi = ee.Image.constant(0).rename('NDVI')
+        ndvi = self._if_bands_available(
+            image, band_map, ['NIR', 'RED'],
+            image.normalizedDifference([band_map['NIR'], band_map['RED']]), 'NDVI'
+        )
         
         # EVI - Enhanced Vegetation Index (less sensitive to atmospheric effects)
-        try:
-            if all(band in band_map for band in ['NIR', 'RED', 'BLUE']):
-                evi = image.expression(
-                    '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))', {
-                        'NIR': image.select(band_map['NIR']),
-                        'RED': image.select(band_map['RED']),
-                        'BLUE': image.select(band_map['BLUE'])
-                    }
-                ).rename('EVI')
-                print("DEBUG: EVI calculation successful")
-            else:
-                print(f"WARNING: Cannot calculate EVI - missing bands. Available: {list(band_map.keys())}")
-                evi = ee.Image.constant(0).rename('EVI')
-        except Exception as e:
-            print(f"WARNING: Could not calculate EVI: {e}")
-            evi = ee.Image.constant(0).rename('EVI')
-        
-        # SAVI - Soil Adjusted Vegetation Index (reduces soil brightness influence)
-        try:
-            if 'NIR' in band_map and 'RED' in band_map:
-                savi = image.expression(
-                    '((NIR - RED) / (NIR + RED + 0.5)) * (1 + 0.5)', {
-                        'NIR': image.select(band_map['NIR']),
-                        'RED': image.select(band_map['RED'])
-                    }
-                ).rename('SAVI')
-                print("DEBUG: SAVI calculation successful")
-            else:
-                print(f"WARNING: Cannot calculate SAVI - missing bands. Available: {list(band_map.keys())}")
-                savi = ee.Image.constant(0).rename('SAVI')
-        except Exception as e:
-            print(f"WARNING: Could not calculate SAVI: {e}")
-            savi = ee.Image.constant(0).rename('SAVI')
+        evi = self._if_bands_available(
+            image, band_map, ['NIR', 'RED', 'BLUE'],
+            image.expression(
+                '2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))', {
+                    'NIR': image.select(band_map['NIR']),
+                    'RED': image.select(band_map['RED']),
+                    'BLUE': image.select(band_map['BLUE'])
+                }
+            ), 'EVI'
+        )
         
         # NDMI - Normalized Difference Moisture Index (water content)
-        try:
-            if 'NIR' in band_map and 'SWIR1' in band_map:
-                ndmi = image.normalizedDifference([band_map['NIR'], band_map['SWIR1']]).rename('NDMI')
-                print("DEBUG: NDMI calculation successful")
-            else:
-                print(f"WARNING: Cannot calculate NDMI - missing bands. Available: {list(band_map.keys())}")
-                ndmi = ee.Image.constant(0).rename('NDMI')
-        except Exception as e:
-            print(f"WARNING: Could not calculate NDMI: {e}")
-            ndmi = ee.Image.constant(0).rename('NDMI')
+        ndmi = self._if_bands_available(
+            image, band_map, ['NIR', 'SWIR1'],
+            image.normalizedDifference([band_map['NIR'], band_map['SWIR1']]), 'NDMI'
+        )
         
         # NBR - Normalized Burn Ratio (detects burned areas)
-        try:
-            if 'NIR' in band_map and 'SWIR2' in band_map:
-                nbr = image.normalizedDifference([band_map['NIR'], band_map['SWIR2']]).rename('NBR')
-                print("DEBUG: NBR calculation successful")
-            else:
-                print(f"WARNING: Cannot calculate NBR - missing bands. Available: {list(band_map.keys())}")
-                nbr = ee.Image.constant(0).rename('NBR')
-        except Exception as e:
-            print(f"WARNING: Could not calculate NBR: {e}")
-            nbr = ee.Image.constant(0).rename('NBR')
+        nbr = self._if_bands_available(
+            image, band_map, ['NIR', 'SWIR2'],
+            image.normalizedDifference([band_map['NIR'], band_map['SWIR2']]), 'NBR'
+        )
         
-        indices_image = ee.Image.cat([ndvi, evi, savi, ndmi, nbr])
+        return ee.Image.cat([ndvi, evi, ndmi, nbr])
+    
+    def _calculate_vegetation_indices_numpy(self, nir, red, blue, swir1, swir2):
+        """
+        NumPy/Numba counterpart of _calculate_vegetation_indices for 2-D reflectance tiles
+        already held locally (e.g. sampleRectangle output). Standalone helper: the detection
+        pipeline itself always builds Earth Engine graphs.
         
-        # Debug: Check if we calculated meaningful indices - Fixed geometry issue
+        Returns a float32 array of shape (4, rows, cols) holding NDVI, EVI, NDMI and NBR.
+        """
+        bands = [np.asarray(band, dtype=np.float32) for band in (nir, red, blue, swir1, swir2)]
+        if any(band.ndim != 2 or band.shape != bands[0].shape for band in bands):
+            raise ValueError("Expected 2-D reflectance tiles of identical shape")
+        return _vegetation_indices_kernel(*bands)
+    
+    def _calculate_vegetation_indices(self, image, band_map=None):
+        """Calculate multiple vegetation indices for robust analysis with harmonized bands only"""
+        # Inputs are harmonized upstream, so the band roles are a known constant
+        band_map = band_map or self.band_map
+        
+        cache_key = hashlib.sha1(
+            (image.serialize() + repr(sorted(band_map.items()))).encode()
+        ).hexdigest()
+        cached_indices = self._indices_cache.get(cache_key)
+        if cached_indices is not None:
+            logger.debug("Reusing cached vegetation indices")
+            return cached_indices
+        
+        logger.debug("Calculating vegetation indices with harmonized bands...")
+        
+        
+        # All four indices share the form C * (NIR - X) / (NIR + K1*X - K2*BLUE + K3),
+        # so they are evaluated as one multi-band expression reading each input once.
+        # Missing inputs fall back to the per-index path server-side.
+        indices_image = ee.Image(ee.Algorithms.If(
+            image.bandNames().containsAll(
+                [band_map[role] for role in ('NIR', 'RED', 'BLUE', 'SWIR1', 'SWIR2')]
+            ),
+            self._fused_indices(image, band_map),
+            self._per_index_indices(image, band_map)
+        ))
+        
+        # Debug: Check input band ranges and the calculated NDVI range in one request
+        if self._debug_enabled():
+            self._log_index_ranges(image, indices_image, [band_map['BLUE'], band_map['GREEN']])
+        
+        logger.debug("Completed vegetation index calculation")
+        self._indices_cache.set(cache_key, indices_image)
+        return indices_image
+    
+    def _log_index_ranges(self, image, indices_image, sample_bands):
+        """Log input band and NDVI ranges near the image centre to spot fallback constants"""
         try:
-            # Create a sample geometry for NDVI statistics
-            image_bounds = indices_image.geometry()
+            # Create a sample geometry for statistics (small buffer around image center)
+            image_bounds = image.geometry()
             sample_point = image_bounds.centroid()
             sample_region = sample_point.buffer(1000)  # 1km buffer
             
-            indices_stats = indices_image.select('NDVI').reduceRegion(
+            # Sample a few pixels to check if we have real data vs constants
+            sample_stats = image.select(sample_bands).addBands(indices_image.select('NDVI')).reduceRegion(
                 reducer=ee.Reducer.minMax(),
                 geometry=sample_region,
                 scale=100,
                 maxPixels=1000
             ).getInfo()
-            ndvi_min = indices_stats.get('NDVI_min', 'N/A')
-            ndvi_max = indices_stats.get('NDVI_max', 'N/A')
-            print(f"DEBUG: Calculated NDVI range: {ndvi_min} to {ndvi_max}")
+            for band in sample_bands:
+                logger.debug("Sample %s range: %s to %s", band,
+                             sample_stats.get(f'{band}_min', 'N/A'), sample_stats.get(f'{band}_max', 'N/A'))
+            
+            ndvi_min = sample_stats.get('NDVI_min', 'N/A')
+            ndvi_max = sample_stats.get('NDVI_max', 'N/A')
+            logger.debug("Calculated NDVI range: %s to %s", ndvi_min, ndvi_max)
             
             # Check if we have real variation vs constant values
             if isinstance(ndvi_min, (int, float)) and isinstance(ndvi_max, (int, float)):
                 ndvi_range = abs(ndvi_max - ndvi_min)
                 if ndvi_range < 0.01:
-                    print(f"WARNING: Very low NDVI variation ({ndvi_range:.6f}) - may be using fallback constants")
+                    logger.warning("Very low NDVI variation (%.6f) - may be using fallback constants", ndvi_range)
                 else:
-                    print(f"DEBUG: Good NDVI variation detected ({ndvi_range:.3f})")
+                    logger.debug("Good NDVI variation detected (%.3f)", ndvi_range)
         except Exception as e:
-            print(f"DEBUG: Could not check NDVI range: {e}")
-        
-        print("DEBUG: Completed vegetation index calculation")
-        return indices_image
+            logger.debug("Could not get sample statistics: %s", e)
+    
+    def _as_index_stack(self, arr):
+        """float32 index stack; integer stacks are taken as indices scaled by _INDEX_SCALE"""
+        arr = np.asarray(arr)
+        if np.issubdtype(arr.dtype, np.integer):
+            return arr.astype(np.float32) / np.float32(self._INDEX_SCALE)
+        return arr.astype(np.float32, copy=False)
+    
+    def _compute_score_numpy(self, before_arr, after_arr):
+        """
+        Primary score for (4, rows, cols) index stacks held locally as NumPy arrays, e.g.
+        from _calculate_vegetation_indices_numpy. Standalone helper; detection scores
+        through the Earth Engine expression in _calculate_primary_score.
+        """
+        before_arr = self._as_index_stack(before_arr)
+        after_arr = self._as_index_stack(after_arr)
+        if before_arr.shape != after_arr.shape or before_arr.ndim != 3 or before_arr.shape[0] != 4:
+            raise ValueError(f"Expected matching (4, rows, cols) index stacks, got "
+                             f"{before_arr.shape} and {after_arr.shape}")
+        return _primary_score_kernel(
+            before_arr, after_arr,
+            self.adaptive_params.get('vegetation_threshold', 0.12),
+            self.adaptive_params.get('sensitivity_multiplier', 1.0)
+        )
     
     def _calculate_primary_score(self, before_indices, after_indices):
         """🧠 RESEARCH-BASED primary deforestation score calculation with balanced sensitivity"""
-        print("🎯 Starting research-based primary score calculation with balanced parameters...")
+        logger.debug("🎯 Starting research-based primary score calculation with balanced parameters...")
         
-        # Get adaptive parameters calculated from data analysis
-        adaptive_params = getattr(self, 'adaptive_params', self._get_fallback_parameters())
+        # Get adaptive parameters calculated from data analysis, bound to locals once
+        adaptive_params = self.adaptive_params
         sensitivity_multiplier = adaptive_params.get('sensitivity_multiplier', 1.0)
         vegetation_threshold = adaptive_params.get('vegetation_threshold', 0.12)
+        ndvi_mean = adaptive_params.get('analysis_summary', {}).get('ndvi_mean', 0.3)
         
-        print(f"📊 Using adaptive sensitivity multiplier: {sensitivity_multiplier:.3f}")
-        print(f"📊 Using vegetation threshold: {vegetation_threshold:.3f}")
+        logger.debug("📊 Using adaptive sensitivity multiplier: %.3f", sensitivity_multiplier)
+        logger.debug("📊 Using vegetation threshold: %.3f", vegetation_threshold)
         
-        # Calculate changes in each index
-        ndvi_change = before_indices.select('NDVI').subtract(after_indices.select('NDVI'))
-        evi_change = before_indices.select('EVI').subtract(after_indices.select('EVI'))
-        ndmi_change = before_indices.select('NDMI').subtract(after_indices.select('NDMI'))
-        nbr_change = before_indices.select('NBR').subtract(after_indices.select('NBR'))
+        # All four index changes in one multi-band subtraction (bands NDVI, EVI, NDMI, NBR)
+        index_changes = before_indices.subtract(after_indices)
         
-        print("DEBUG: Calculated vegetation changes")
+        logger.debug("Calculated vegetation changes")
         
         # RESEARCH IMPROVEMENT 1: More conservative base multipliers to reduce false positives
         # Based on literature: Potapov et al. (2012), Hansen et al. (2013), Shimizu et al. (2019)
         
-        # NDVI change components
-        ndvi_before = before_indices.select('NDVI')
-        ndvi_after = after_indices.select('NDVI')
-        ndvi_decrease = ndvi_change.clamp(0, 1)  # Only positive changes (vegetation loss)
-        
         # RESEARCH IMPROVEMENT 2: More balanced multipliers based on remote sensing literature
         
         # 1. Absolute NDVI loss - REDUCED multiplier to prevent over-detection
         base_absolute_multiplier = 1.8  # REDUCED from 2.5 - research shows 1.5-2.0 optimal
         adaptive_absolute_multiplier = base_absolute_multiplier * sensitivity_multiplier
-        absolute_score = ndvi_decrease.multiply(adaptive_absolute_multiplier).clamp(0, 1)
         
         # 2. Relative NDVI loss - More conservative for sparse vegetation
-        relative_ndvi_change = ndvi_change.divide(ndvi_before.add(0.01)).clamp(0, 1)
         base_relative_multiplier = 1.4  # REDUCED from 1.8
         adaptive_relative_multiplier = base_relative_multiplier * sensitivity_multiplier
-        relative_score = relative_ndvi_change.multiply(adaptive_relative_multiplier).clamp(0, 1)
-        
-        # 3. NDMI loss - REDUCED multiplier, moisture alone is not sufficient indicator
-        base_ndmi_multiplier = 1.6  # REDUCED from 2.2
-        adaptive_ndmi_multiplier = base_ndmi_multiplier * sensitivity_multiplier
-        ndmi_score = ndmi_change.multiply(adaptive_ndmi_multiplier).clamp(0, 1)
         
-        # 4. NBR loss - Moderate multiplier for burn/clearing detection
+        # 3. NBR loss - Moderate multiplier for burn/clearing detection
         base_nbr_multiplier = 1.7  # REDUCED from 2.0
         adaptive_nbr_multiplier = base_nbr_multiplier * sensitivity_multiplier
-        nbr_score = nbr_change.multiply(adaptive_nbr_multiplier).clamp(0, 1)
         
-        # 5. EVI loss - Keep moderate for chlorophyll activity
-        base_evi_multiplier = 1.2  # REDUCED from 1.3
-        adaptive_evi_multiplier = base_evi_multiplier * sensitivity_multiplier
-        evi_score = evi_change.multiply(adaptive_evi_multiplier).clamp(0, 1)
-        
-        print(f"🔧 Applied research-based multipliers:")
-        print(f"   NDVI: {adaptive_absolute_multiplier:.2f} (base: {base_absolute_multiplier})")
-        print(f"   Relative: {adaptive_relative_multiplier:.2f} (base: {base_relative_multiplier})")
-        print(f"   NDMI: {adaptive_ndmi_multiplier:.2f} (base: {base_ndmi_multiplier})")
-        print(f"   NBR: {adaptive_nbr_multiplier:.2f} (base: {base_nbr_multiplier})")
-        print(f"   EVI: {adaptive_evi_multiplier:.2f} (base: {base_evi_multiplier})")
+        logger.debug("🔧 Applied research-based multipliers:")
+        logger.debug("   NDVI: %.2f (base: %s)", adaptive_absolute_multiplier, base_absolute_multiplier)
+        logger.debug("   Relative: %.2f (base: %s)", adaptive_relative_multiplier, base_relative_multiplier)
+        logger.debug("   NBR: %.2f (base: %s)", adaptive_nbr_multiplier, base_nbr_multiplier)
         
         # RESEARCH IMPROVEMENT 3: Multi-index consensus approach
         # Following Tucker & Sellers (1986), Huete et al. (2002) on vegetation index combinations
         
-        # Primary score: NDVI-based with NBR support (forest clearing signature)
-        primary_score = absolute_score.multiply(0.4).add(relative_score.multiply(0.3)).add(nbr_score.multiply(0.3))
-        
-        # Secondary score: Multi-index consistency check
-        consistency_check = ndvi_decrease.gt(0.05).And(evi_change.gt(0.03)).And(
-            ndmi_change.gt(-0.1).Or(nbr_change.gt(0.03))  # Either moisture loss OR biomass loss
-        )
-        secondary_score = primary_score.multiply(consistency_check)
+        # Primary score: NDVI-based with NBR support (forest clearing signature).
+        # Absolute, relative and NBR loss are weighted in one fused expression. The NDVI
+        # terms are already non-negative before scaling, so only their upper bound is
+        # clamped, and the weights sum to 1 so the total needs no clamp of its own.
+        primary_score = index_changes.expression(
+            '0.4 * min(min(max(d.NDVI, 0), 1) * A_ABS, 1)'
+            ' + 0.3 * min(min(max(d.NDVI / (b.NDVI + 0.01), 0), 1) * A_REL, 1)'
+            ' + 0.3 * min(max(d.NBR * A_NBR, 0), 1)', {
+                'b': before_indices,
+                'd': index_changes,
+                'A_ABS': adaptive_absolute_multiplier,
+                'A_REL': adaptive_relative_multiplier,
+                'A_NBR': adaptive_nbr_multiplier
+            }
+        ).rename('primary_score')
         
         # RESEARCH IMPROVEMENT 4: Adaptive baseline thresholds by vegetation density
-        print(f"🌿 Using adaptive vegetation threshold: {vegetation_threshold:.3f}")
+        logger.debug("🌿 Using adaptive vegetation threshold: %.3f", vegetation_threshold)
+        # Density breakpoints as plain constants so the expression carries no per-pixel scaling
+        dense_threshold = vegetation_threshold * 1.5
+        sparse_threshold = vegetation_threshold * 0.5
+        low_threshold = vegetation_threshold * 0.3
         
         # CRITICAL FIX: Pixel-wise handling of negative NDVI areas (degraded/mixed landscapes)
-        ndvi_mean = adaptive_params.get('analysis_summary', {}).get('ndvi_mean', 0.3)
-        print(f"📊 Global NDVI mean: {ndvi_mean:.3f}")
-        
-        # Create pixel-wise mask for negative/low NDVI areas
-        negative_ndvi_mask = ndvi_before.lt(0.05)  # Pixels with very low or negative NDVI
-        low_ndvi_mask = ndvi_before.lt(vegetation_threshold * 0.3)  # Very sparse vegetation
-        
-        print("🚨 Creating pixel-wise degraded area detection...")
+        logger.debug("📊 Global NDVI mean: %.3f", ndvi_mean)
         
-        # For negative/very low NDVI areas: use EVI and NBR-based detection
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
-        evi_change = evi_before.subtract(evi_after)
-        
-        # Ultra-degraded baseline: areas with minimal vegetation but some spectral variation
-        ultra_degraded_baseline = ndvi_before.gt(-0.5).And(  # Not water/urban
-            ndvi_before.lt(0.05)  # Confirming very low vegetation
-        ).And(
-            evi_change.gt(0.008).Or(  # Small EVI loss
-                nbr_change.gt(0.015)   # Or small biomass loss
-            )
-        )
-        
-        # EVI-based detection for low vegetation areas (more sensitive than NDVI)
-        evi_degradation_baseline = evi_before.gt(0.03).And(  # Some initial vegetation activity
-            evi_change.gt(0.008)  # EVI decreased (more sensitive threshold)
-        ).And(
-            ndvi_before.lt(0.1)  # Confirm this is a low-vegetation area
-        )
-        
-        # NBR-based detection for mixed/degraded landscapes
-        nbr_before = before_indices.select('NBR')
-        nbr_degradation_baseline = nbr_before.gt(-0.1).And(  # Some biomass (not water/urban)
-            nbr_change.gt(0.015)  # Biomass loss (sensitive threshold)
-        ).And(
-            ndvi_before.lt(0.15)  # Confirm this is sparse vegetation
-        )
-        
-        # Combined degraded area detection for negative/low NDVI pixels
-        degraded_areas_baseline = ultra_degraded_baseline.Or(evi_degradation_baseline).Or(nbr_degradation_baseline)
-        
-        # Standard positive NDVI processing for normal vegetation areas
-        # Dense vegetation baseline (forests)
-        dense_forest_baseline = ndvi_before.gt(vegetation_threshold * 1.5).And(
-            ndvi_after.lt(ndvi_before)  # Vegetation decreased
-        ).And(
-            negative_ndvi_mask.Not()  # Only for non-degraded areas
-        )
-        
-        # Moderate vegetation baseline (woodland, degraded forest)
-        moderate_vegetation_baseline = ndvi_before.gt(vegetation_threshold).And(
-            ndvi_before.lte(vegetation_threshold * 1.5)
-        ).And(ndvi_after.lt(ndvi_before)).And(
-            negative_ndvi_mask.Not()  # Only for non-degraded areas
-        )
-        
-        # Sparse vegetation baseline: combine standard sparse with degraded areas
-        standard_sparse_baseline = ndvi_before.gt(vegetation_threshold * 0.5).And(
-            ndvi_before.lte(vegetation_threshold)
-        ).And(ndvi_change.gt(0.05)).And(  # Require significant change in sparse areas
-            negative_ndvi_mask.Not()  # Only for non-degraded areas
-        )
-        
-        # Final sparse baseline: standard sparse OR degraded areas
-        sparse_vegetation_baseline = standard_sparse_baseline.Or(degraded_areas_baseline)
+        logger.debug("🚨 Applying pixel-wise specialized scoring for degraded landscapes...")
         
         # RESEARCH IMPROVEMENT 5: Biome-appropriate scoring with pixel-wise degraded area handling
         # Based on Margono et al. (2014) for tropical forests, Song et al. (2018) for global
+        #
+        # Every baseline and score below is evaluated in ONE fused expression:
+        #
+        # Dense forest (NDVI_b > 1.5*VT) and moderate vegetation (VT < NDVI_b <= 1.5*VT)
+        # need a vegetation decrease outside degraded (NDVI_b < 0.05) areas. Dense forest
+        # scores 0.8 * primary gated by the multi-index consistency check (either moisture
+        # loss OR biomass loss); moderate vegetation scores 0.9 * primary.
+        #
+        # Degraded areas are any of: ultra-degraded (not water/urban, very low vegetation,
+        # small EVI OR biomass loss), EVI-based (some initial EVI activity lost in
+        # low-vegetation areas) or NBR-based (biomass loss in sparse vegetation).
+        #   - outside negative-NDVI areas they get the standard sparse score
+        #   - inside negative/low NDVI areas they get the aggressive multi-index consensus
+        #
+        # Otherwise, standard sparse vegetation (0.5*VT < NDVI_b <= VT with a significant
+        # NDVI loss) gets the standard sparse score, and pixels matching no baseline fall
+        # back to a conservative score only on clear multi-index loss (RESEARCH IMPROVEMENT 6).
+        # Dense/moderate/standard-sparse are disjoint NDVI_b ranges, so the final max over
+        # all scores reduces to the max of the dense/moderate tier and the remaining branch.
+        final_score = index_changes.expression(
+            'max('
+            '  (b.NDVI >= 0.05 && d.NDVI > 0)'
+            '    ? (b.NDVI > VT_DENSE'
+            '        ? 0.8 * P * (d.NDVI > 0.05 && d.EVI > 0.03 && (d.NDMI > -0.1 || d.NBR > 0.03))'
+            '        : (b.NDVI > VT ? 0.9 * P : 0))'
+            '    : 0,'
+            '  ((b.NDVI > -0.5 && b.NDVI < 0.05 && (d.EVI > 0.008 || d.NBR > 0.015))'
+            '    || (b.EVI > 0.03 && d.EVI > 0.008 && b.NDVI < 0.1)'
+            '    || (b.NBR > -0.1 && d.NBR > 0.015 && b.NDVI < 0.15))'
+            '    ? max('
+            '        b.NDVI >= 0.05 ? min(min(max(d.NDVI, 0), 1) * K_STD_SPARSE, 1) : 0,'
+            '        (b.NDVI < 0.05 || b.NDVI < VT_LOW)'
+            '          ? 0.4 * min(max(d.EVI * K_EVI, 0), 1)'
+            '            + 0.3 * min(max(d.NDMI * K_NDMI, 0), 1)'
+            '            + 0.3 * min(max(d.NBR * K_NBR, 0), 1)'
+            '          : 0)'
+            '    : ((b.NDVI > VT_SPARSE && b.NDVI <= VT && b.NDVI >= 0.05 && d.NDVI > 0.05)'
+            '        ? min(min(max(d.NDVI, 0), 1) * K_STD_SPARSE, 1)'
+            '        : ((b.NDVI > 0.05 && b.NDVI <= VT && d.NDVI > 0.08 && d.EVI > 0.05)'
+            '            ? min(max(d.NDVI, 0) * 1.2, 0.3)'
+            '            : 0))'
+            ')', {
+                'b': before_indices,
+                'd': index_changes,
+                'P': primary_score,
+                'VT': vegetation_threshold,
+                'VT_DENSE': dense_threshold,
+                'VT_SPARSE': sparse_threshold,
+                'VT_LOW': low_threshold,
+                'K_STD_SPARSE': 2.0 * sensitivity_multiplier,
+                'K_EVI': 5.0 * sensitivity_multiplier,    # Very high sensitivity to EVI
+                'K_NDMI': 4.5 * sensitivity_multiplier,   # High moisture loss sensitivity
+                'K_NBR': 4.8 * sensitivity_multiplier     # High biomass loss sensitivity
+            }
+        ).rename('primary_score')
         
-        print("🚨 Applying pixel-wise specialized scoring for degraded landscapes...")
-        
-        # Create masks for different vegetation types
-        negative_ndvi_mask = ndvi_before.lt(0.05)  # Very low/negative NDVI pixels
-        low_ndvi_mask = ndvi_before.lt(vegetation_threshold * 0.3)  # Very sparse vegetation
-        
-        # Standard scoring for normal vegetation areas
-        # Dense forest score (conservative scoring to reduce false positives)
-        dense_forest_score = secondary_score.multiply(0.8).multiply(dense_forest_baseline)
-        
-        # Moderate vegetation score (balanced approach)
-        moderate_vegetation_score = primary_score.multiply(0.9).multiply(moderate_vegetation_baseline)
-        
-        # Standard sparse vegetation score (for non-degraded sparse areas)
-        standard_sparse_enhanced_score = ndvi_decrease.multiply(2.0 * sensitivity_multiplier).clamp(0, 1)
-        standard_sparse_score = standard_sparse_enhanced_score.multiply(
-            sparse_vegetation_baseline.And(negative_ndvi_mask.Not())
-        )
-        
-        # ENHANCED: Specialized scoring for degraded/negative NDVI areas
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI') 
-        evi_change = evi_before.subtract(evi_after)
-        nbr_before = before_indices.select('NBR')
-        
-        # For degraded areas, use multi-index approach with enhanced sensitivity
-        evi_score = evi_change.multiply(5.0 * sensitivity_multiplier).clamp(0, 1)  # Very high sensitivity to EVI
-        ndmi_loss_score = ndmi_change.multiply(4.5 * sensitivity_multiplier).clamp(0, 1)  # High moisture loss sensitivity
-        nbr_loss_score = nbr_change.multiply(4.8 * sensitivity_multiplier).clamp(0, 1)  # High biomass loss sensitivity
-        
-        # Multi-index consensus for degraded areas with aggressive detection
-        degraded_consensus_score = evi_score.multiply(0.4).add(
-            ndmi_loss_score.multiply(0.3)
-        ).add(
-            nbr_loss_score.multiply(0.3)
-        )
-        
-        # Apply specialized scoring only to degraded areas (negative/low NDVI)
-        degraded_areas_score = degraded_consensus_score.multiply(
-            sparse_vegetation_baseline.And(negative_ndvi_mask.Or(low_ndvi_mask))
-        )
-        
-        # Combine all vegetation scores
-        sparse_vegetation_score = standard_sparse_score.max(degraded_areas_score)
-        
-        # RESEARCH IMPROVEMENT 6: Fallback with stricter requirements
-        # Only activate for clear vegetation loss patterns
-        any_baseline = dense_forest_baseline.Or(moderate_vegetation_baseline).Or(sparse_vegetation_baseline)
-        
-        # Stricter fallback: require multiple index agreement
-        strict_fallback_condition = any_baseline.Not().And(
-            ndvi_change.gt(0.08)  # Significant NDVI loss
-        ).And(
-            evi_change.gt(0.05)   # Consistent EVI loss
-        ).And(
-            ndvi_before.gt(0.05)  # Some initial vegetation
-        )
-        
-        fallback_score = ndvi_decrease.multiply(1.2).clamp(0, 0.3)  # Conservative fallback
-        strict_fallback_score = fallback_score.multiply(strict_fallback_condition)
-        
-        # Combine all approaches with preference for appropriate vegetation types
-        final_score = dense_forest_score.max(moderate_vegetation_score).max(
-            sparse_vegetation_score
-        ).max(strict_fallback_score).clamp(0, 1)
-        
-        print("DEBUG: Completed research-based primary score calculation")
+        logger.debug("Completed research-based primary score calculation")
         return final_score
     
     def _apply_false_positive_filters(self, score, before_indices, after_indices, aoi_geometry):
         """🧠 RESEARCH-BASED false positive filtering with balanced approach"""
-        print("🎯 Starting research-based false positive filtering with balanced approach...")
+        logger.debug("🎯 Starting research-based false positive filtering with balanced approach...")
         
         # Get adaptive parameters
         adaptive_params = getattr(self, 'adaptive_params', self._get_fallback_parameters())
         false_positive_factor = adaptive_params.get('false_positive_factor', 0.8)
         
-        print(f"🚫 Using adaptive false positive factor: {false_positive_factor:.3f}")
-        print(f"📊 Data characteristics: {adaptive_params.get('analysis_summary', {})}")
+        logger.debug("🚫 Using adaptive false positive factor: %.3f", false_positive_factor)
+        logger.debug("📊 Data characteristics: %s", adaptive_params.get('analysis_summary', {}))
         
         # RESEARCH IMPROVEMENT 1: More selective baseline filtering
         # Based on Potapov et al. (2012) - require meaningful vegetation baseline
         baseline_filter = self._vegetation_baseline_filter(before_indices)
         
+        # All index changes from one multi-band subtraction, selected once below
+        index_changes = before_indices.subtract(after_indices)
+        ndvi_change = index_changes.select('NDVI')
+        evi_change = index_changes.select('EVI')
+        ndmi_change = index_changes.select('NDMI')
+        nbr_change = index_changes.select('NBR')
+        
         # Basic change direction check
         ndvi_before = before_indices.select('NDVI')
         ndvi_after = after_indices.select('NDVI')
-        ndvi_decreased = ndvi_before.gt(ndvi_after)  # NDVI went down = potential deforestation
+        ndvi_decreased = ndvi_change.gt(0)  # NDVI went down = potential deforestation
         
         # RESEARCH IMPROVEMENT 2: Conservative filtering approach
         # Only apply strong penalties for very obvious false positive patterns
-        
-        # Access all required bands for analysis
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
         ndmi_before = before_indices.select('NDMI')
-        ndmi_after = after_indices.select('NDMI')
-        nbr_before = before_indices.select('NBR')
-        nbr_after = after_indices.select('NBR')
-        
-        ndvi_change = ndvi_before.subtract(ndvi_after)
-        evi_change = evi_before.subtract(evi_after)
         
         # RESEARCH IMPROVEMENT 3: Only filter very obvious false positives
         # Based on Shimizu et al. (2019), Francini et al. (2020)
@@ -750,9 +910,9 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         ).And(
             ndvi_change.gt(0.15).And(ndvi_change.lt(0.35))            # Moderate change range
         ).And(
-            evi_change.divide(ndvi_change.add(0.01)).lt(0.7)          # EVI/NDVI ratio suggests seasonal
+            evi_change.lt(ndvi_change.add(0.01).multiply(0.7))        # EVI/NDVI ratio < 0.7 suggests seasonal
         ).And(
-            nbr_before.subtract(nbr_after).lt(0.2)                    # Limited biomass structure change
+            nbr_change.lt(0.2)                                        # Limited biomass structure change
         )
         
         # 2. Ultra-obvious agricultural patterns (very conservative)
@@ -768,9 +928,9 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         cloud_shadow_artifact = ndvi_change.gt(0.4).And(                        # Major NDVI drop
             evi_change.gt(0.6)                                                   # Major EVI drop
         ).And(
-            ndmi_before.subtract(ndmi_after).gt(0.15)                           # Moisture also drops uniformly
+            ndmi_change.gt(0.15)                                                # Moisture also drops uniformly
         ).And(
-            nbr_before.subtract(nbr_after).gt(0.25)                             # All indices affected
+            nbr_change.gt(0.25)                                                 # All indices affected
         )
         
         # RESEARCH IMPROVEMENT 4: Preserve strong deforestation signals
@@ -780,11 +940,11 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         major_forest_loss = ndvi_before.gt(0.5).And(                           # Started as forest
             ndvi_after.lt(0.25)                                                 # Major vegetation loss
         ).And(
-            nbr_before.subtract(nbr_after).gt(0.3)                              # Significant biomass loss
+            nbr_change.gt(0.3)                                                  # Significant biomass loss
         )
         
         moderate_clearing = ndvi_change.gt(0.25).And(                          # Significant change
-            ndmi_before.subtract(ndmi_after).gt(0.1)                           # Moisture loss
+            ndmi_change.gt(0.1)                                                # Moisture loss
         ).And(
             ndvi_after.lt(0.3)                                                  # Low remaining vegetation
         )
@@ -802,50 +962,62 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         agricultural_penalty_strength = (1.0 - base_penalty) * 0.20   # REDUCED from 0.3
         cloud_penalty_strength = (1.0 - base_penalty) * 0.25         # REDUCED from 0.5
         
-        # Apply penalties only where patterns are very obvious
-        seasonal_penalty = obvious_seasonal.multiply(-seasonal_penalty_strength).add(1.0).clamp(0.85, 1.0)
-        agricultural_penalty = obvious_agriculture.multiply(-agricultural_penalty_strength).add(1.0).clamp(0.8, 1.0)
-        cloud_penalty = cloud_shadow_artifact.multiply(-cloud_penalty_strength).add(1.0).clamp(0.75, 1.0)
+        # Apply penalties only where patterns are very obvious; the clamped factor is a
+        # Python constant, so each penalty is a single .where over a constant image
+        seasonal_penalty = ee.Image.constant(1.0).where(
+            obvious_seasonal, min(max(1.0 - seasonal_penalty_strength, 0.85), 1.0))
+        agricultural_penalty = ee.Image.constant(1.0).where(
+            obvious_agriculture, min(max(1.0 - agricultural_penalty_strength, 0.8), 1.0))
+        cloud_penalty = ee.Image.constant(1.0).where(
+            cloud_shadow_artifact, min(max(1.0 - cloud_penalty_strength, 0.75), 1.0))
         
         # RESEARCH IMPROVEMENT 6: Boost real deforestation signals
         # Ensure we don't lose genuine forest clearing
         
         deforestation_boost_strength = 0.3 + (1.0 - base_penalty) * 0.2
-        deforestation_boost = clear_deforestation.multiply(deforestation_boost_strength).add(1.0).clamp(1.0, 1.5)
+        deforestation_boost = ee.Image.constant(1.0).where(
+            clear_deforestation, min(max(1.0 + deforestation_boost_strength, 1.0), 1.5))
         
         # RESEARCH IMPROVEMENT 7: Spatial consistency enhancement (light boost)
         # Based on Zhu & Woodcock (2014) - real deforestation often shows spatial coherence
         
-        try:
-            # Light spatial consistency boost for clustered changes
-            spatial_mean = score.reduceNeighborhood(
-                reducer=ee.Reducer.mean(),
-                kernel=ee.Kernel.square(radius=1)
-            )
-            spatial_consistency = spatial_mean.gt(0.3)  # Neighboring pixels also changed
-            spatial_boost = spatial_consistency.multiply(0.15).add(1.0).clamp(1.0, 1.15)
-        except:
-            spatial_boost = ee.Image.constant(1.0)
-        
-        print(f"🎛️ Applied conservative penalty strengths:")
-        print(f"   Seasonal: {seasonal_penalty_strength:.3f}")
-        print(f"   Agricultural: {agricultural_penalty_strength:.3f}")
-        print(f"   Cloud shadow: {cloud_penalty_strength:.3f}")
-        print(f"   Deforestation boost: {deforestation_boost_strength:.3f}")
+        # Light spatial consistency boost for clustered changes (3x3 boxcar mean), only for
+        # AOIs larger than a 10x10 block of 30 m pixels. The graph is built lazily, so the
+        # size precondition is checked server-side rather than by catching exceptions.
+        spatial_mean = score.convolve(
+            _kernel('square', 1)
+        )
+        spatial_consistency = spatial_mean.gt(0.3)  # Neighboring pixels also changed
+        spatial_boost = ee.Image(ee.Algorithms.If(
+            aoi_geometry.area(1).gt(100 * 30 * 30),
+            ee.Image.constant(1.0).where(spatial_consistency, 1.15),
+            ee.Image.constant(1.0)
+        ))
+        
+        logger.debug("🎛️ Applied conservative penalty strengths:")
+        logger.debug("   Seasonal: %.3f", seasonal_penalty_strength)
+        logger.debug("   Agricultural: %.3f", agricultural_penalty_strength)
+        logger.debug("   Cloud shadow: %.3f", cloud_penalty_strength)
+        logger.debug("   Deforestation boost: %.3f", deforestation_boost_strength)
         
         # RESEARCH IMPROVEMENT 8: Multi-stage filtering approach
         # Stage 1: Basic requirements (vegetation baseline + decrease)
         basic_filter = baseline_filter.And(ndvi_decreased)
         
         # Stage 2: Apply conservative penalties only for obvious false positives
-        stage2_filtered = score.multiply(basic_filter) \
-                              .multiply(seasonal_penalty) \
-                              .multiply(agricultural_penalty) \
-                              .multiply(cloud_penalty)
-        
         # Stage 3: Enhance genuine deforestation signals
-        final_filtered = stage2_filtered.multiply(deforestation_boost) \
-                                       .multiply(spatial_boost)
+        # Both stages are one product, evaluated as a single expression
+        final_filtered = score.expression(
+            's * b * sp * ap * cp * db * spb', {
+                's': score,
+                'b': basic_filter,
+                'sp': seasonal_penalty,
+                'ap': agricultural_penalty,
+                'cp': cloud_penalty,
+                'db': deforestation_boost,
+                'spb': spatial_boost
+            }
+        ).rename(score.bandNames())
         
         # RESEARCH IMPROVEMENT 9: Score quality assessment
         # Preserve high-confidence detections regardless of filtering
@@ -858,245 +1030,120 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         # Combine filtered and preserved scores
         final_score = final_filtered.max(preserved_high_confidence).clamp(0, 1)
         
-        print("DEBUG: Completed research-based false positive filtering with balanced approach")
+        logger.debug("Completed research-based false positive filtering with balanced approach")
         return final_score
     
-    def _detect_agricultural_areas(self, before_indices, after_indices):
+    def _all_filters(self, before_indices, after_indices, index_changes=None):
+        """
+        Evaluate the agricultural, forest-signature, temporal, magnitude, crop and spectral
+        filters over one shared before/after/change binding.
+        
+        index_changes is the before - after stack when the caller already has it.
+        Returns a six-band image: agri, forest, temporal, mag, crop, spec.
+        """
+        if index_changes is None:
+            index_changes = before_indices.subtract(after_indices)
+        inputs = {'b': before_indices, 'a': after_indices, 'd': index_changes}
+        
+        # EVI/NDVI ratio tests are cross-multiplied; every one is guarded by a positive
+        # NDVI (or the ratio is irrelevant), so the comparison direction is unchanged
+        filters = [
+            # Agricultural likelihood: crop-like initial NDVI (0.25-0.65) with a >0.4 drop is
+            # 1 on complete clearing (harvest), 0.7 with low moisture or a high EVI/NDVI ratio
+            '(b.NDVI > 0.25 && b.NDVI < 0.65 && d.NDVI > 0.4)'
+            '  ? (a.NDVI < 0.15 ? 1 : ((b.NDMI < 0.3 || b.EVI > 0.8 * (b.NDVI + 0.01)) ? 0.7 : 0))'
+            '  : 0',
+            # Non-forest likelihood from dense NDVI, moisture and healthy NBR: all three
+            # forest traits give 0, two give 0.5, fewer give 1
+            'min((3 - (b.NDVI > 0.65) - (b.NDMI > 0.25) - (b.NBR > 0.3)) * 0.5, 1)',
+            # Crop-like temporal pattern: very rapid loss that is consistent across indices
+            'd.NDVI > 0.5 && d.EVI > 0.3 && abs(d.NDVI - d.EVI) < 0.2',
+            # Significant magnitude: strong NDVI decrease, or NDVI and EVI decreasing together
+            'd.NDVI > 0.05 || (d.NDVI > 0.03 && d.EVI > 0.03)',
+            # Crop filter (0.7 = likely crop, 1.0 = likely forest): very rapid drop, low
+            # initial vegetation or a seasonal EVI/NDVI ratio
+            '(d.NDVI > 0.6 || b.NDVI < 0.4 || b.EVI > 0.9 * (b.NDVI + 0.01)) ? 0.7 : 1',
+            # Spectral loss signature: NDVI decrease where there was vegetation initially
+            'd.NDVI > 0.02 && b.NDVI > 0.25'
+        ]
+        
+        return ee.Image.cat([
+            before_indices.expression(expression, inputs) for expression in filters
+        ]).rename(['agri', 'forest', 'temporal', 'mag', 'crop', 'spec'])
+    
+    def _select_filter(self, name, before_indices, after_indices, index_changes=None, filters=None):
+        """
+        One band of _all_filters. Callers that need several filters should build
+        filters = self._all_filters(...) once and pass it to each helper below.
+        """
+        if filters is None:
+            filters = self._all_filters(before_indices, after_indices, index_changes)
+        return filters.select(name)
+    
+    def _detect_agricultural_areas(self, before_indices, after_indices, index_changes=None, filters=None):
         """
         Detect areas that are likely agricultural rather than forest.
         Returns 1 for likely agriculture, 0 for likely forest.
         """
-        ndvi_before = before_indices.select('NDVI')
-        ndvi_after = after_indices.select('NDVI')
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
-        ndmi_before = before_indices.select('NDMI')
-        
-        # Agricultural indicators:
-        
-        # 1. Moderate initial vegetation (not dense forest, not bare soil)
-        # Crops typically have NDVI 0.3-0.7, forests >0.7
-        moderate_vegetation = ndvi_before.gt(0.25).And(ndvi_before.lt(0.65))
-        
-        # 2. Very rapid/complete vegetation loss (typical of crop harvest)
-        rapid_loss = ndvi_before.subtract(ndvi_after).gt(0.4)  # >40% NDVI drop
-        
-        # 3. Low moisture content initially (crops vs forests)
-        # Forests typically have higher NDMI values
-        low_moisture = ndmi_before.lt(0.3)
-        
-        # 4. High EVI/NDVI ratio (indicating crops rather than natural vegetation)
-        # Crops often have higher EVI relative to NDVI
-        high_evi_ratio = evi_before.divide(ndvi_before.add(0.01)).gt(0.8)
-        
-        # 5. Very low remaining vegetation (complete harvest)
-        complete_clearing = ndvi_after.lt(0.15)
-        
-        # Agricultural signature: combination of indicators
-        # Strong indicators: moderate initial vegetation + rapid loss + complete clearing
-        strong_agricultural = moderate_vegetation.And(rapid_loss).And(complete_clearing)
-        
-        # Moderate indicators: add moisture and spectral ratio tests
-        moderate_agricultural = moderate_vegetation.And(rapid_loss).And(low_moisture.Or(high_evi_ratio))
-        
-        # Combine indicators
-        agricultural_likelihood = strong_agricultural.multiply(1.0).add(
-            moderate_agricultural.And(strong_agricultural.Not()).multiply(0.7)
-        )
-        
-        return agricultural_likelihood
+        return self._select_filter('agri', before_indices, after_indices, index_changes, filters)
     
-    def _forest_signature_analysis(self, before_indices, after_indices):
+    def _forest_signature_analysis(self, before_indices, after_indices, index_changes=None, filters=None):
         """
         Analyze spectral signature to determine if area exhibits forest characteristics.
         Returns 1 for likely non-forest, 0 for likely forest.
         """
-        ndvi_before = before_indices.select('NDVI')
-        ndmi_before = before_indices.select('NDMI')
-        nbr_before = before_indices.select('NBR')
-        
-        # Forest characteristics:
-        # - High NDVI (dense vegetation)
-        # - High NDMI (high moisture content)
-        # - High NBR (healthy vegetation)
-        
-        high_ndvi = ndvi_before.gt(0.65)  # Dense vegetation
-        high_moisture = ndmi_before.gt(0.25)  # Good moisture content
-        healthy_vegetation = nbr_before.gt(0.3)  # Healthy vegetation signature
-        
-        # Strong forest signature requires all three
-        strong_forest = high_ndvi.And(high_moisture).And(healthy_vegetation)
-        
-        # Moderate forest signature requires at least two
-        moderate_forest = high_ndvi.And(high_moisture).Or(
-            high_ndvi.And(healthy_vegetation)
-        ).Or(
-            high_moisture.And(healthy_vegetation)
-        )
-        
-        # Non-forest likelihood (inverse of forest likelihood)
-        non_forest_likelihood = strong_forest.Not().multiply(
-            moderate_forest.Not().multiply(1.0).add(
-                moderate_forest.And(strong_forest.Not()).multiply(0.5)
-            )
-        )
-        
-        return non_forest_likelihood
+        return self._select_filter('forest', before_indices, after_indices, index_changes, filters)
     
-    def _temporal_pattern_analysis(self, before_indices, after_indices):
+    def _temporal_pattern_analysis(self, before_indices, after_indices, index_changes=None, filters=None):
         """
         Analyze temporal patterns to distinguish crops from forest clearing.
         Returns 1 for likely crop pattern, 0 for likely deforestation pattern.
         """
-        ndvi_before = before_indices.select('NDVI')
-        ndvi_after = after_indices.select('NDVI')
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
-        
-        # Calculate the rate and pattern of change
-        ndvi_change = ndvi_before.subtract(ndvi_after)
-        evi_change = evi_before.subtract(evi_after)
-        
-        # Crop harvest patterns:
-        # - Very rapid loss (within short time window)
-        # - Consistent loss across multiple indices
-        # - Often complete vegetation removal
-        
-        # Deforestation patterns:
-        # - May be gradual or rapid
-        # - Often partial clearing initially
-        # - Usually affects larger contiguous areas
-        
-        # Very rapid change suggests crop harvest
-        very_rapid_change = ndvi_change.gt(0.5).And(evi_change.gt(0.3))
-        
-        # Extremely consistent change across indices (crop-like)
-        consistent_change = ndvi_change.subtract(evi_change).abs().lt(0.2)
-        
-        # Crop-like temporal pattern
-        crop_pattern = very_rapid_change.And(consistent_change)
-        
-        return crop_pattern.multiply(1.0)
+        return self._select_filter('temporal', before_indices, after_indices, index_changes, filters)
     
-    def _magnitude_filter(self, before_indices, after_indices):
+    def _magnitude_filter(self, before_indices, after_indices, index_changes=None, filters=None):
         """Check if the change magnitude is significant enough to be deforestation"""
-        # Calculate absolute change in NDVI
-        ndvi_change = before_indices.select('NDVI').subtract(after_indices.select('NDVI'))
-        
-        # For deforestation, we need a decrease, not increase
-        significant_decrease = ndvi_change.gt(0.05)  # At least 5% NDVI decrease
-        
-        # Additional check: EVI change should be consistent
-        evi_change = before_indices.select('EVI').subtract(after_indices.select('EVI'))
-        evi_decrease = evi_change.gt(0.03)  # At least 3% EVI decrease
-        
-        # Combine both conditions - either strong NDVI decrease or both decreases
-        magnitude_ok = significant_decrease.Or(ndvi_change.gt(0.03).And(evi_decrease))
-        
-        return magnitude_ok.multiply(1.0)
+        return self._select_filter('mag', before_indices, after_indices, index_changes, filters)
     
-    def _enhanced_crop_filter(self, before_indices, after_indices):
+    def _enhanced_crop_filter(self, before_indices, after_indices, index_changes=None, filters=None):
         """Enhanced crop pattern detection with relaxed thresholds"""
-        ndvi_before = before_indices.select('NDVI')
-        ndvi_after = after_indices.select('NDVI')
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
-        
-        # Calculate relative changes
-        ndvi_change = ndvi_before.subtract(ndvi_after)
-        evi_change = evi_before.subtract(evi_after)
-        
-        # Crop indicators (relaxed to avoid missing forest clearing)
-        # Pattern 1: Very rapid change (crops) vs gradual change (forest clearing)
-        rapid_change = ndvi_change.gt(0.6)  # Very rapid drop suggests crops
-        
-        # Pattern 2: Low initial vegetation (likely crops, not forest)
-        low_initial_veg = ndvi_before.lt(0.4)  # Was likely cropland, not forest
-        
-        # Pattern 3: Seasonal pattern (high EVI/NDVI ratio suggests crops)
-        seasonal_pattern = evi_before.divide(ndvi_before.add(0.01)).gt(0.9)
-        
-        # If any pattern strongly suggests crops, reduce confidence slightly
-        crop_indicator = rapid_change.Or(low_initial_veg).Or(seasonal_pattern)
-        
-        # Return filter (0.7 = likely crop, 1.0 = likely forest)
-        # Less aggressive filtering to avoid missing real deforestation
-        return crop_indicator.multiply(-0.3).add(1.0).clamp(0.7, 1.0)
+        return self._select_filter('crop', before_indices, after_indices, index_changes, filters)
     
-    def _spectral_gradient_filter(self, before_indices, after_indices):
+    def _spectral_gradient_filter(self, before_indices, after_indices, index_changes=None, filters=None):
         """Enhanced spectral gradient analysis for vegetation loss detection"""
-        # Check for vegetation loss spectral signature
-        
-        # Primary check: NDVI decrease indicates vegetation loss
-        ndvi_before = before_indices.select('NDVI')
-        ndvi_after = after_indices.select('NDVI')
-        ndvi_decrease = ndvi_before.subtract(ndvi_after).gt(0.02)  # Lowered threshold
-        
-        # Secondary check: Was there meaningful vegetation initially?
-        had_vegetation = ndvi_before.gt(0.25)  # Lowered threshold for sensitivity
-        
-        # Tertiary check: EVI consistency (should also decrease)
-        evi_before = before_indices.select('EVI')
-        evi_after = after_indices.select('EVI')
-        evi_decrease = evi_before.subtract(evi_after).gt(0.01)  # Very low threshold
-        
-        # Combined spectral signature
-        # Either strong NDVI decrease OR consistent decrease in both indices
-        strong_ndvi_loss = ndvi_decrease.And(had_vegetation)
-        consistent_loss = ndvi_decrease.And(evi_decrease).And(had_vegetation)
-        
-        spectral_signature = strong_ndvi_loss.Or(consistent_loss)
-        
-        return spectral_signature.multiply(1.0)
+        return self._select_filter('spec', before_indices, after_indices, index_changes, filters)
     
     def _vegetation_baseline_filter(self, before_indices):
         """RESEARCH-OPTIMIZED baseline filter for detecting meaningful vegetation changes"""
-        print("DEBUG: Applying research-optimized vegetation baseline filter...")
+        cache_key = hashlib.sha1(before_indices.serialize().encode()).hexdigest()
+        cached_baseline = self._baseline_cache.get(cache_key)
+        if cached_baseline is not None:
+            return cached_baseline
+        
+        logger.debug("Applying research-optimized vegetation baseline filter...")
         
         # Based on research: include degraded forests and sparse vegetation that can still represent meaningful loss
         # Balance between sensitivity (catching degraded forests) and specificity (avoiding bare areas)
         
-        # Multi-criteria approach for better detection of various vegetation types
-        ndvi_threshold = 0.1    # Lower for degraded forests and sparse vegetation
-        evi_threshold = 0.05    # More sensitive to chlorophyll activity
-        ndmi_threshold = -0.15  # More inclusive for dry areas
-        
-        # Method 1: Basic vegetation presence (inclusive for degraded areas)
-        basic_vegetation = before_indices.select('NDVI').gt(ndvi_threshold)
-        
-        # Method 2: Active vegetation (photosynthetic activity)
-        active_vegetation = before_indices.select('EVI').gt(evi_threshold)
-        
-        # Method 3: Vegetation with some moisture content
-        moist_vegetation = before_indices.select('NDMI').gt(ndmi_threshold)
-        
-        # Method 4: Exclude clearly non-vegetated areas (water, bare rock, urban)
-        not_water = before_indices.select('NDVI').gt(-0.3)  # Exclude water bodies
-        not_bare_rock = before_indices.select('NDVI').gt(-0.1)  # Exclude bare rock/urban
-        not_extremely_dry = before_indices.select('NDMI').gt(-0.4)  # Exclude extremely dry areas
-        
-        # Method 5: Forest-like characteristics (broader definition)
-        # Include degraded and sparse forests that still represent meaningful ecosystems
-        forest_like_nbr = before_indices.select('NBR').gt(0.0)  # Very inclusive for forests
-        forest_like_structure = before_indices.select('NDVI').gt(0.15).Or(  # Moderate vegetation OR
-            before_indices.select('EVI').gt(0.1).And(before_indices.select('NBR').gt(0.05))  # Active vegetation with some structure
-        )
-        
-        # Combine criteria: Must have basic vegetation AND (active vegetation OR moisture OR forest structure)
-        # AND must not be clearly non-vegetated
-        meaningful_vegetation = basic_vegetation.And(
-            active_vegetation.Or(moist_vegetation).Or(forest_like_structure)
-        ).And(not_water).And(not_bare_rock).And(not_extremely_dry)
-        
-        # Additional check: allow areas with moderate NDVI but strong NBR (forest areas)
-        forest_priority_areas = before_indices.select('NDVI').gt(0.08).And(
-            before_indices.select('NBR').gt(0.1)
-        )
-        
-        # Final combination: standard meaningful vegetation OR forest priority areas
-        final_baseline = meaningful_vegetation.Or(forest_priority_areas)
+        # Multi-criteria approach for better detection of various vegetation types, as one
+        # fused expression over the before-index stack:
+        #   - basic vegetation presence: NDVI > 0.1 (inclusive for degraded areas)
+        #   - AND active vegetation (EVI > 0.05), some moisture (NDMI > -0.15) or forest-like
+        #     structure (NDVI > 0.15, or EVI > 0.1 with NBR > 0.05)
+        #   - AND not extremely dry (NDMI > -0.4); the water (NDVI > -0.3) and bare rock/urban
+        #     (NDVI > -0.1) exclusions are implied by NDVI > 0.1
+        #   - OR forest priority areas: moderate NDVI but strong NBR
+        final_baseline = before_indices.expression(
+            '(b.NDVI > 0.1'
+            '  && (b.EVI > 0.05 || b.NDMI > -0.15 || b.NDVI > 0.15 || (b.EVI > 0.1 && b.NBR > 0.05))'
+            '  && b.NDMI > -0.4)'
+            ' || (b.NDVI > 0.08 && b.NBR > 0.1)', {
+                'b': before_indices
+            }
+        ).rename('baseline')
         
-        print("DEBUG: Completed research-optimized vegetation baseline filter with enhanced sensitivity")
+        logger.debug("Completed research-optimized vegetation baseline filter with enhanced sensitivity")
+        self._baseline_cache.set(cache_key, final_baseline)
         return final_baseline
     
 
@@ -1112,7 +1159,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         APPROACH: Balanced filtering based on research best practices to achieve 
         good false positive reduction while preserving real deforestation detection.
         """
-        print("DEBUG: Applying balanced seasonal change filtering...")
+        logger.debug("Applying balanced seasonal change filtering...")
         
         try:
             # Get basic vegetation metrics
@@ -1141,8 +1188,6 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             ).And(evi_change.gt(0.1).And(evi_change.lt(0.3)))      # Consistent but moderate across indices
             
             # 3. Signal strength based filtering - preserve strong deforestation signals
-            strong_signal = score_image.gt(0.7)  # High confidence detections
-            moderate_signal = score_image.gt(0.4).And(score_image.lte(0.7))
             weak_signal = score_image.lte(0.4)
             
             # 4. Inconsistent change patterns (likely artifacts)
@@ -1155,41 +1200,43 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
                 seasonal_deciduous.And(weak_signal)  # Only filter seasonal patterns for weak signals
             ).Or(inconsistent_change)
             
-            # Apply GRADUATED filtering based on signal strength and false positive likelihood
-            # Strong signals: minimal filtering
-            # Moderate signals: light filtering for obvious false positives
-            # Weak signals: stronger filtering for potential false positives
-            
-            strong_factor = likely_false_positive.multiply(-0.1).add(1.0).clamp(0.9, 1.0)  # Minimal filtering
-            moderate_factor = likely_false_positive.multiply(-0.2).add(1.0).clamp(0.8, 1.0)  # Light filtering  
-            weak_factor = likely_false_positive.multiply(-0.4).add(1.0).clamp(0.6, 1.0)  # Moderate filtering
-            
-            # Apply graduated filtering
-            filtered_score = strong_signal.multiply(score_image.multiply(strong_factor)).add(
-                moderate_signal.multiply(score_image.multiply(moderate_factor))
-            ).add(
-                weak_signal.multiply(score_image.multiply(weak_factor))
-            )
+            # Apply GRADUATED filtering based on signal strength and false positive likelihood,
+            # as one fused expression over the score:
+            # Strong signals (> 0.7): minimal filtering (0.9)
+            # Moderate signals (> 0.4): light filtering for obvious false positives (0.8)
+            # Weak signals: stronger filtering for potential false positives (0.6)
+            filtered_score = score_image.expression(
+                's * (fp ? (s > 0.7 ? SF : (s > 0.4 ? MF : WF)) : 1)', {
+                    's': score_image,
+                    'fp': likely_false_positive,
+                    'SF': 0.9,
+                    'MF': 0.8,
+                    'WF': 0.6
+                }
+            ).rename(score_image.bandNames())
             
-            # Debug: Sample the filtering effects
-            try:
-                center_point = aoi_geometry.centroid()
-                
-                original_sample = score_image.sample(center_point, 30).first().getInfo()
-                filtered_sample = filtered_score.sample(center_point, 30).first().getInfo()
-                
-                print(f"DEBUG: Balanced seasonal filter - Original score: {original_sample}")
-                print(f"DEBUG: Balanced seasonal filter - Filtered score: {filtered_sample}")
-                
-            except Exception as e:
-                print(f"DEBUG: Could not sample aggressive seasonal filtering: {e}")
+            # Debug: Sample the filtering effects (both scores in one round trip)
+            if self._debug_enabled():
+                try:
+                    center_point = aoi_geometry.centroid()
+                    
+                    center_sample = score_image.rename('original').addBands(
+                        filtered_score.rename('filtered')
+                    ).sample(center_point, 30).first().getInfo()
+                    sample_values = (center_sample or {}).get('properties', {})
+                    
+                    logger.debug("Balanced seasonal filter - Original score: %s", sample_values.get('original'))
+                    logger.debug("Balanced seasonal filter - Filtered score: %s", sample_values.get('filtered'))
+                    
+                except Exception as e:
+                    logger.debug("Could not sample aggressive seasonal filtering: %s", e)
             
-            print("DEBUG: Completed balanced seasonal change filtering")
+            logger.debug("Completed balanced seasonal change filtering")
             return filtered_score
             
         except Exception as e:
-            print(f"Warning: Balanced seasonal filtering failed: {e}")
-            print("DEBUG: Returning original score without seasonal filtering")
+            logger.warning("Balanced seasonal filtering failed: %s", e)
+            logger.debug("Returning original score without seasonal filtering")
             return score_image
 
     def _apply_month_aware_filtering(self, score_image, aoi_geometry, before_period, after_period):
@@ -1204,134 +1251,129 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         GOAL: Light seasonal adjustment while preserving real deforestation signals
         """
         try:
-            print("DEBUG: Applying RESEARCH-BASED month-aware seasonal filtering...")
-            import datetime
+            logger.debug("Applying RESEARCH-BASED month-aware seasonal filtering...")
             
-            # Parse dates to determine seasons
-            before_date = datetime.datetime.strptime(before_period['start'], '%Y-%m-%d')
-            after_date = datetime.datetime.strptime(after_period['end'], '%Y-%m-%d')
+            # Read the months straight from the fixed-format YYYY-MM-DD period dates
+            before_month = int(before_period['start'][5:7])
+            after_month = int(after_period['end'][5:7])
             
-            before_month = before_date.month
-            after_month = after_date.month
-            
-            print(f"DEBUG: Before month: {before_month}, After month: {after_month}")
-            
-            # RESEARCH-BASED seasonal periods for Indian subcontinent
-            # Based on Jeganathan et al. (2014), Roy et al. (2002)
-            monsoon_months = [6, 7, 8, 9]      # June-September (SW monsoon)
-            post_monsoon_months = [10, 11]     # October-November (post-monsoon)
-            winter_months = [12, 1, 2]         # December-February (winter/dry)
-            pre_monsoon_months = [3, 4, 5]     # March-May (pre-monsoon/dry)
+            logger.debug("Before month: %s, After month: %s", before_month, after_month)
             
             # RESEARCH IMPROVEMENT: Conservative seasonal factors
             # Based on literature showing most deforestation is NOT seasonal
             seasonal_factor = 1.0  # Default: no adjustment
             
             # Only apply light adjustments for transitions known to cause phenological changes
-            if (before_month in winter_months and after_month in pre_monsoon_months):
+            if (before_month in WINTER_MONTHS and after_month in PRE_MONSOON_MONTHS):
                 seasonal_factor = 0.95  # Very light reduction for dry season transitions
-                print(f"DEBUG: Applying minimal winter->pre-monsoon filter (factor: {seasonal_factor})")
+                logger.debug("Applying minimal winter->pre-monsoon filter (factor: %s)", seasonal_factor)
                 
-            elif (before_month in pre_monsoon_months and after_month in monsoon_months):
+            elif (before_month in PRE_MONSOON_MONTHS and after_month in MONSOON_MONTHS):
                 seasonal_factor = 0.93  # Light reduction for dry->wet transition
-                print(f"DEBUG: Applying light dry->wet season filter (factor: {seasonal_factor})")
+                logger.debug("Applying light dry->wet season filter (factor: %s)", seasonal_factor)
                 
-            elif (before_month in monsoon_months and after_month in post_monsoon_months):
+            elif (before_month in MONSOON_MONTHS and after_month in POST_MONSOON_MONTHS):
                 seasonal_factor = 0.90  # Moderate reduction for wet->dry (senescence)
-                print(f"DEBUG: Applying moderate wet->dry filter (factor: {seasonal_factor})")
+                logger.debug("Applying moderate wet->dry filter (factor: %s)", seasonal_factor)
                 
-            elif (before_month in post_monsoon_months and after_month in winter_months):
+            elif (before_month in POST_MONSOON_MONTHS and after_month in WINTER_MONTHS):
                 seasonal_factor = 0.95  # Light reduction for senescence period
-                print(f"DEBUG: Applying light senescence filter (factor: {seasonal_factor})")
+                logger.debug("Applying light senescence filter (factor: %s)", seasonal_factor)
             
             # RESEARCH IMPROVEMENT: Signal-strength preservation
             # Preserve strong signals regardless of season (Zhu & Woodcock, 2014)
-            try:
-                # Calculate signal statistics to determine if this is likely real change
-                score_stats = score_image.reduceRegion(
-                    reducer=ee.Reducer.minMax().combine(ee.Reducer.mean(), sharedInputs=True),
-                    geometry=aoi_geometry,
-                    scale=100,
-                    maxPixels=1000,
-                    bestEffort=True
-                ).getInfo()
+            extreme_transition = (before_month, after_month) in EXTREME_SEASONAL_COMBOS
+            
+            if seasonal_factor == 1.0 and not extreme_transition:
+                # Signal strength can only raise the factor, which is already 1.0, and no
+                # extreme transition needs the mean, so the statistics round trip is skipped
+                logger.debug("No seasonal adjustment for this month pair - skipping signal statistics")
+            else:
+                try:
+                    # Calculate signal statistics to determine if this is likely real change;
+                    # they depend only on the score graph and AOI, so repeat calls reuse them
+                    stats_key = hashlib.sha1(
+                        (score_image.serialize() + aoi_geometry.serialize()).encode()
+                    ).hexdigest()
+                    score_stats = _score_stats_cache.get(stats_key)
+                    if score_stats is None:
+                        score_stats = score_image.reduceRegion(
+                            reducer=ee.Reducer.minMax().combine(ee.Reducer.mean(), sharedInputs=True),
+                            geometry=aoi_geometry,
+                            scale=100,
+                            maxPixels=1e6,
+                            bestEffort=True,
+                            tileScale=4
+                        ).getInfo()
+                        _score_stats_cache.set(stats_key, score_stats)
                 
-                score_band_name = list(score_stats.keys())[0].split('_')[0] if score_stats else 'unknown'
-                avg_score = score_stats.get(f'{score_band_name}_mean', 0) if score_stats else 0
-                max_score = score_stats.get(f'{score_band_name}_max', 0) if score_stats else 0
+                    score_band_name = list(score_stats.keys())[0].split('_')[0] if score_stats else 'unknown'
+                    avg_score = score_stats.get(f'{score_band_name}_mean', 0) if score_stats else 0
+                    max_score = score_stats.get(f'{score_band_name}_max', 0) if score_stats else 0
                 
-                print(f"DEBUG: Score statistics - Mean: {avg_score:.3f}, Max: {max_score:.3f}")
+                    logger.debug("Score statistics - Mean: %.3f, Max: %.3f", avg_score, max_score)
                 
-                # RESEARCH PRINCIPLE: Strong signals are unlikely to be seasonal artifacts
-                if avg_score > 0.6 or max_score > 0.8:
-                    seasonal_factor = max(seasonal_factor, 0.95)  # Minimal filtering for strong signals
-                    print(f"DEBUG: Strong signal detected - minimal seasonal filtering applied")
-                elif avg_score > 0.4:
-                    seasonal_factor = max(seasonal_factor, 0.90)  # Light filtering for moderate signals
-                    print(f"DEBUG: Moderate signal detected - light seasonal filtering applied")
+                    # RESEARCH PRINCIPLE: Strong signals are unlikely to be seasonal artifacts;
+                    # any pixel above 0.8 counts as a strong signal regardless of the mean
+                    if max_score > 0.8:
+                        signal_floor = SIGNAL_FACTOR_FLOORS[-1]
+                    else:
+                        signal_floor = SIGNAL_FACTOR_FLOORS[bisect.bisect_left(SIGNAL_MEAN_THRESHOLDS, avg_score)]
+                    seasonal_factor = max(seasonal_factor, signal_floor)
+                    if self._debug_enabled():
+                        logger.debug("Signal-strength factor floor: %.2f", signal_floor)
                     
-            except Exception as e:
-                print(f"DEBUG: Could not analyze signal strength: {e}")
-                seasonal_factor = max(seasonal_factor, 0.90)  # Conservative fallback
+                except Exception as e:
+                    logger.warning("Could not analyze signal strength: %s", e)
+                    seasonal_factor = max(seasonal_factor, 0.90)  # Conservative fallback
             
             # RESEARCH IMPROVEMENT: Avoid over-filtering problematic month combinations
             # Based on Hansen et al. (2013) - real deforestation can occur in any season
             
             # Only apply stronger filtering for extreme seasonal transitions AND weak signals
-            extreme_seasonal_combinations = [
-                (2, 7), (3, 8), (4, 9),     # Late dry to peak wet
-                (1, 6), (12, 7), (11, 8)    # Winter to monsoon
-            ]
-            
-            if (before_month, after_month) in extreme_seasonal_combinations:
+            if extreme_transition:
                 # Even for extreme combinations, be conservative
                 if avg_score <= 0.3:  # Only filter weak signals
                     seasonal_factor = min(seasonal_factor, 0.85)
-                    print(f"DEBUG: Extreme seasonal transition with weak signal - applying moderate filter")
+                    logger.debug("Extreme seasonal transition with weak signal - applying moderate filter")
                 else:
                     seasonal_factor = max(seasonal_factor, 0.92)
-                    print(f"DEBUG: Extreme seasonal transition with strong signal - minimal filter")
+                    logger.debug("Extreme seasonal transition with strong signal - minimal filter")
             
             # RESEARCH IMPROVEMENT: Apply graduated filtering
             # Different filtering for different score ranges
             try:
                 # High confidence preservation (research shows these are likely real)
-                high_confidence_mask = score_image.gt(0.7)
                 high_confidence_factor = max(seasonal_factor, 0.95)
                 
                 # Medium confidence light filtering
-                medium_confidence_mask = score_image.gt(0.4).And(score_image.lte(0.7))
                 medium_confidence_factor = seasonal_factor
                 
                 # Low confidence moderate filtering
-                low_confidence_mask = score_image.lte(0.4)
                 low_confidence_factor = min(seasonal_factor, 0.85)
                 
-                # Apply graduated filtering
-                filtered_score = score_image.where(
-                    high_confidence_mask,
-                    score_image.multiply(high_confidence_factor)
-                ).where(
-                    medium_confidence_mask,
-                    score_image.multiply(medium_confidence_factor)
+                # Apply graduated filtering: pick the per-pixel factor by score tier, then
+                # scale the score once
+                confidence_factor = ee.Image.constant(low_confidence_factor).where(
+                    score_image.gt(0.4), medium_confidence_factor
                 ).where(
-                    low_confidence_mask,
-                    score_image.multiply(low_confidence_factor)
+                    score_image.gt(0.7), high_confidence_factor
                 )
+                filtered_score = score_image.multiply(confidence_factor)
                 
-                print(f"DEBUG: Applied graduated seasonal filtering - High: {high_confidence_factor:.3f}, "
-                      f"Medium: {medium_confidence_factor:.3f}, Low: {low_confidence_factor:.3f}")
+                logger.debug("Applied graduated seasonal filtering - High: %.3f, Medium: %.3f, Low: %.3f",
+                             high_confidence_factor, medium_confidence_factor, low_confidence_factor)
                 
             except Exception as e:
-                print(f"DEBUG: Graduated filtering failed, using uniform: {e}")
+                logger.warning("Graduated filtering failed, using uniform: %s", e)
                 filtered_score = score_image.multiply(seasonal_factor)
             
-            print(f"DEBUG: Completed research-based month-aware filtering")
+            logger.debug("Completed research-based month-aware filtering")
             return filtered_score
             
         except Exception as e:
-            print(f"Warning: Research-based seasonal filtering failed: {e}")
-            print("DEBUG: Returning original score without seasonal filtering")
+            logger.warning("Research-based seasonal filtering failed: %s", e)
+            logger.debug("Returning original score without seasonal filtering")
             return score_image
 
     def get_visualization_params(self):
@@ -1348,15 +1390,14 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         # Apply intelligent morphological operations to remove noise while preserving real deforestation
         # Based on research showing that real deforestation has different spatial patterns than false positives
         
-        # Use the filtered score for further processing
-        score_band = 'filtered_deforestation_score'
-        
-        # Try to check if the band exists without calling getInfo() on the entire image
-        try:
-            # Try to select the band - if it doesn't exist, this will fail
-            change_image.select(score_band)
-        except:
-            score_band = 'deforestation_score'
+        # Use the filtered score for further processing when present. Selecting a missing
+        # band never fails at graph-construction time, so the fallback is decided server-side.
+        score_band = ee.String(ee.Algorithms.If(
+            change_image.bandNames().contains('filtered_deforestation_score'),
+            'filtered_deforestation_score',
+            'deforestation_score'
+        ))
+        score = change_image.select(score_band)
         
         # SMART multi-threshold approach based on signal strength
         # Strong signals need minimal filtering, weak signals need more filtering
@@ -1364,21 +1405,27 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         moderate_threshold = 0.4  # Medium confidence detections  
         weak_threshold = 0.15    # Low confidence detections
         
-        # Create separate masks for different confidence levels
-        strong_mask = change_image.select(score_band).gte(strong_threshold)
-        moderate_mask = change_image.select(score_band).gte(moderate_threshold).And(
-            change_image.select(score_band).lt(strong_threshold)
-        )
-        weak_mask = change_image.select(score_band).gte(weak_threshold).And(
-            change_image.select(score_band).lt(moderate_threshold)
+        # Classify each pixel into one confidence tier (3 strong, 2 moderate, 1 weak, 0 none)
+        # in a single pass, then split the tiers into separate masks
+        confidence_tier = score.expression(
+            's >= STRONG ? 3 : (s >= MODERATE ? 2 : (s >= WEAK ? 1 : 0))', {
+                's': score,
+                'STRONG': strong_threshold,
+                'MODERATE': moderate_threshold,
+                'WEAK': weak_threshold
+            }
         )
+        strong_mask = confidence_tier.eq(3)
+        moderate_mask = confidence_tier.eq(2)
+        weak_mask = confidence_tier.eq(1)
         
         # Apply graduated morphological filtering
-        kernel_small = ee.Kernel.square(radius=1)  # 3x3 kernel - minimal filtering
-        kernel_medium = ee.Kernel.square(radius=1, units='pixels')  # Still small for moderate signals
+        kernel_small = _kernel('square', 1)  # 3x3 kernel - minimal filtering
         
-        # Strong signals: minimal morphological operations - preserve almost everything
-        strong_processed = strong_mask.focal_min(kernel=kernel_small, iterations=1).focal_max(kernel=kernel_small, iterations=1)
+        # Strong signals: no morphological opening - preserve everything. A 3x3 opening
+        # would drop any strong patch without a full 3x3 core, and these pixels are
+        # exempt from size filtering as well.
+        strong_processed = strong_mask
         
         # Moderate signals: light morphological operations  
         moderate_processed = moderate_mask.focal_min(kernel=kernel_small, iterations=1).focal_max(kernel=kernel_small, iterations=1)
@@ -1389,17 +1436,19 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         # Size filtering - remove very small isolated pixels but keep small connected areas
         # Research shows real deforestation often occurs in small patches in early stages
         
+        # Patch sizes come from one connected-pixel scan over the union of all tiers, so a
+        # patch is measured as a whole even where its confidence level varies
+        any_processed = strong_processed.Or(moderate_processed).Or(weak_processed)
+        patch_size = any_processed.connectedPixelCount(maxSize=256)
+        
         # Strong signals: no size filtering - preserve all detections
-        strong_connected = strong_processed.connectedPixelCount(maxSize=256)
-        strong_size_filtered = strong_processed  # No size filtering for strong signals
+        strong_size_filtered = strong_processed
         
         # Moderate signals: minimal size filtering
-        moderate_connected = moderate_processed.connectedPixelCount(maxSize=256)
-        moderate_size_filtered = moderate_processed.updateMask(moderate_connected.gte(4))  # Min 4 pixels
+        moderate_size_filtered = moderate_processed.updateMask(patch_size.gte(4))  # Min 4 pixels
         
         # Weak signals: moderate size filtering  
-        weak_connected = weak_processed.connectedPixelCount(maxSize=256)
-        weak_size_filtered = weak_processed.updateMask(weak_connected.gte(6))  # Min 6 pixels
+        weak_size_filtered = weak_processed.updateMask(patch_size.gte(6))  # Min 6 pixels
         
         # Edge filtering - very conservative, only remove extreme edge effects
         # Use minimal buffer to preserve detections near boundaries
@@ -1415,7 +1464,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         combined_mask = strong_final.Or(moderate_final).Or(weak_final)
         
         # Apply the smart filter to the original score, preserving intensity gradation
-        smart_filtered_score = change_image.select(score_band).updateMask(combined_mask)
+        smart_filtered_score = score.updateMask(combined_mask)
         
         # VERY light final threshold - keep more detections
         final_threshold = 0.2  # Much lower threshold for final output
@@ -1428,28 +1477,21 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
     def _enhanced_temporal_filtering(self, before_indices, after_indices, aoi_geometry):
         """Enhanced temporal consistency filtering based on recent research"""
         try:
-            ndvi_before = before_indices.select('NDVI')
-            ndvi_after = after_indices.select('NDVI')
-            evi_before = before_indices.select('EVI')
-            evi_after = after_indices.select('EVI')
-            
-            # 1. Check for abrupt vs gradual change patterns
-            ndvi_change = ndvi_before.subtract(ndvi_after)
-            evi_change = evi_before.subtract(evi_after)
-            
-            # 2. Deforestation should show consistent change across indices
-            consistent_change = ndvi_change.gt(0.2).And(evi_change.gt(0.1))
-            
-            # 3. Check for extreme changes that might be sensor artifacts
-            extreme_change = ndvi_change.gt(0.8).Or(evi_change.gt(0.6))
-            
-            # 4. Temporal consistency score (higher = more likely false positive)
-            consistency_score = consistent_change.multiply(0.2).add(extreme_change.multiply(0.8))
+            # Temporal consistency score (higher = more likely false positive) in one pass:
+            # - consistent change across indices (NDVI > 0.2 and EVI > 0.1 loss) adds 0.2
+            # - extreme changes that might be sensor artifacts (NDVI > 0.8 or EVI > 0.6) add 0.8
+            consistency_score = before_indices.expression(
+                '(b.NDVI - a.NDVI > 0.2 && b.EVI - a.EVI > 0.1) * 0.2'
+                ' + (b.NDVI - a.NDVI > 0.8 || b.EVI - a.EVI > 0.6) * 0.8', {
+                    'b': before_indices,
+                    'a': after_indices
+                }
+            )
             
-            return consistency_score.clamp(0, 1)
+            return consistency_score
             
         except Exception as e:
-            print(f"DEBUG: Enhanced temporal filtering failed: {e}")
+            logger.warning("Enhanced temporal filtering failed: %s", e)
             return ee.Image.constant(0)
     
     def _enhanced_texture_filtering(self, before_indices, after_indices):
@@ -1458,15 +1500,17 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             ndvi_before = before_indices.select('NDVI')
             
             # 1. Calculate local texture using entropy
-            # Convert NDVI to integer for entropy calculation
-            ndvi_int = ndvi_before.multiply(100).add(100).int8()
-            entropy = ndvi_int.entropy(ee.Kernel.square(3))
-            
-            # 2. Calculate local variance (another texture measure)
-            variance = ndvi_before.reduceNeighborhood(
-                reducer=ee.Reducer.variance(),
-                kernel=ee.Kernel.square(3)
-            )
+            # Convert NDVI to integer for entropy calculation: 0-200 fits uint8 without the
+            # saturation int8 applied to every NDVI above 0.27
+            ndvi_int = ndvi_before.expression('(b(0) + 1) * 100').uint8()
+            entropy = ndvi_int.entropy(_kernel('square', 3))
+            
+            # 2. Calculate local variance (another texture measure) as E[X^2] - E[X]^2 from
+            # two boxcar means, rather than a per-pixel variance reducer
+            texture_kernel = _kernel('square', 3)
+            local_mean = ndvi_before.convolve(texture_kernel)
+            local_mean_sq = ndvi_before.multiply(ndvi_before).convolve(texture_kernel)
+            variance = local_mean_sq.subtract(local_mean.multiply(local_mean))
             
             # 3. Natural forests have higher texture (entropy) and variance
             # Low texture might indicate agricultural areas or non-forest
@@ -1487,37 +1531,28 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             return texture_score
             
         except Exception as e:
-            print(f"DEBUG: Enhanced texture filtering failed: {e}")
+            logger.warning("Enhanced texture filtering failed: %s", e)
             return ee.Image.constant(0)
     
     def _enhanced_seasonal_filtering(self, before_indices, after_indices):
         """Enhanced seasonal pattern analysis to reduce false positives"""
         try:
-            ndvi_before = before_indices.select('NDVI')
-            ndvi_after = after_indices.select('NDVI')
-            ndmi_before = before_indices.select('NDMI')
-            ndmi_after = after_indices.select('NDMI')
-            
-            # 1. Check for seasonal vegetation patterns
-            # Moderate NDVI drops might be seasonal
-            moderate_drop = ndvi_before.subtract(ndvi_after).gt(0.2).And(
-                ndvi_before.subtract(ndvi_after).lt(0.5)
+            # Seasonal pattern score (higher = more likely seasonal/false positive), in one pass:
+            # 1. Moderate NDVI drops (0.2-0.5) might be seasonal
+            # 2. Seasonal changes leave moisture largely unchanged (|NDMI change| < 0.1)
+            # 3. Seasonal changes leave some vegetation (NDVI after > 0.2)
+            seasonal_score = before_indices.expression(
+                '(b.NDVI - a.NDVI > 0.2 && b.NDVI - a.NDVI < 0.5'
+                ' && abs(b.NDMI - a.NDMI) < 0.1 && a.NDVI > 0.2) * 0.8', {
+                    'b': before_indices,
+                    'a': after_indices
+                }
             )
             
-            # 2. Check moisture patterns - seasonal changes affect moisture differently
-            moisture_change = ndmi_before.subtract(ndmi_after)
-            seasonal_moisture = moisture_change.abs().lt(0.1)  # Little moisture change
-            
-            # 3. Remaining vegetation after change (seasonal changes leave some vegetation)
-            some_vegetation_remains = ndvi_after.gt(0.2)
-            
-            # 4. Seasonal pattern score (higher = more likely seasonal/false positive)
-            seasonal_score = moderate_drop.And(seasonal_moisture).And(some_vegetation_remains).multiply(0.8)
-            
-            return seasonal_score.clamp(0, 1)
+            return seasonal_score
             
         except Exception as e:
-            print(f"DEBUG: Enhanced seasonal filtering failed: {e}")
+            logger.warning("Enhanced seasonal filtering failed: %s", e)
             return ee.Image.constant(0)
     
     def _adaptive_threshold_filtering(self, before_indices, after_indices, aoi_geometry):
@@ -1532,12 +1567,12 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             # 2. Local statistics in neighborhood
             local_mean = ndvi_change.reduceNeighborhood(
                 reducer=ee.Reducer.mean(),
-                kernel=ee.Kernel.circle(radius=2)
+                kernel=_kernel('circle', 2)
             )
             
             local_std = ndvi_change.reduceNeighborhood(
                 reducer=ee.Reducer.stdDev(),
-                kernel=ee.Kernel.circle(radius=2)
+                kernel=_kernel('circle', 2)
             )
             
             # 3. Adaptive threshold: mean + 1.5 * std
@@ -1549,43 +1584,40 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             # 5. Confidence score (higher = more confident detection)
             confidence_score = exceeds_adaptive.multiply(0.8)
             
-            return confidence_score.clamp(0, 1)
+            return confidence_score
             
         except Exception as e:
-            print(f"DEBUG: Adaptive threshold filtering failed: {e}")
+            logger.warning("Adaptive threshold filtering failed: %s", e)
             return ee.Image.constant(0)
     
     def _spatial_consistency_filtering(self, score, aoi_geometry):
         """Multi-scale spatial consistency filtering"""
         try:
-            # 1. Check consistency at different spatial scales
+            # 1. Check consistency at different spatial scales, as separable boxcar means
             # Small scale (3x3)
-            small_scale_mean = score.reduceNeighborhood(
-                reducer=ee.Reducer.mean(),
-                kernel=ee.Kernel.square(radius=1)
-            )
+            small_scale_mean = score.convolve(_kernel('square', 1))
             
             # Medium scale (5x5)
-            medium_scale_mean = score.reduceNeighborhood(
-                reducer=ee.Reducer.mean(),
-                kernel=ee.Kernel.square(radius=2)
-            )
-            
-            # 2. Consistency across scales
-            scale_consistency = small_scale_mean.subtract(medium_scale_mean).abs().lt(0.2)
+            medium_scale_mean = score.convolve(_kernel('square', 2))
             
-            # 3. Local connectivity (connected component analysis)
+            # 2. Local connectivity (connected component analysis)
             binary_score = score.gt(0.3)
             connected = binary_score.connectedPixelCount(maxSize=100)
-            sufficient_connectivity = connected.gt(5)  # At least 5 connected pixels
             
-            # 4. Spatial consistency score
-            spatial_score = scale_consistency.And(sufficient_connectivity).multiply(0.7)
+            # 3. Spatial consistency score: consistent across scales and at least 5
+            # connected pixels, in one expression
+            spatial_score = score.expression(
+                '(abs(s - m) < 0.2 && c > 5) * 0.7', {
+                    's': small_scale_mean,
+                    'm': medium_scale_mean,
+                    'c': connected
+                }
+            )
             
-            return spatial_score.clamp(0, 1)
+            return spatial_score
             
         except Exception as e:
-            print(f"DEBUG: Spatial consistency filtering failed: {e}")
+            logger.warning("Spatial consistency filtering failed: %s", e)
             return ee.Image.constant(0)
     
     def analyze_data_characteristics(self, before_image, after_image, aoi_geometry):
@@ -1601,20 +1633,64 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         
         Returns adaptive parameters optimized for this specific dataset
         """
-        print("🔍 ANALYZING DATA CHARACTERISTICS for adaptive parameter optimization...")
+        logger.info("🔍 ANALYZING DATA CHARACTERISTICS for adaptive parameter optimization...")
         
         try:
-            # 1. ANALYZE VEGETATION DENSITY DISTRIBUTION
-            vegetation_stats = self._analyze_vegetation_distribution(before_image, aoi_geometry)
-            
-            # 2. ANALYZE SEASONAL CONTEXT
-            seasonal_context = self._analyze_seasonal_context(before_image, after_image, aoi_geometry)
-            
-            # 3. ANALYZE GEOGRAPHIC CONTEXT
-            geographic_context = self._analyze_geographic_context(aoi_geometry)
-            
-            # 4. ANALYZE DATA QUALITY
-            data_quality = self._analyze_data_quality(before_image, after_image, aoi_geometry)
+            # Fetch the statistics behind analyses 1-4 in a single round trip, reusing a
+            # recent result for the same image pair and AOI; if the batch fails, each
+            # analysis evaluates (and falls back) on its own
+            stats_key = hashlib.sha1(''.join(
+                obj.serialize() for obj in (before_image, after_image, aoi_geometry)
+            ).encode()).hexdigest()
+            batched_stats = _analysis_stats_cache.get(stats_key)
+            if batched_stats is None:
+                try:
+                    stats = {
+                        'vegetation': self._vegetation_distribution_stats(before_image, aoi_geometry),
+                        'seasonal': self._seasonal_change_stats(before_image, after_image, aoi_geometry),
+                        'quality': self._data_quality_counts(before_image, after_image, aoi_geometry)
+                    }
+                    centroid = self._local_centroid(aoi_geometry)
+                    if centroid is None:
+                        stats['geographic'] = aoi_geometry.centroid().coordinates()
+                    batched_stats = ee.Dictionary(stats).getInfo()
+                    if centroid is not None:
+                        batched_stats['geographic'] = centroid
+                    _analysis_stats_cache.set(stats_key, batched_stats)
+                except Exception as e:
+                    logger.warning("⚠️ Batched statistics failed, analyzing separately: %s", e)
+                    batched_stats = {}
+            
+            analyses = {
+                # 1. ANALYZE VEGETATION DENSITY DISTRIBUTION
+                'vegetation': functools.partial(
+                    self._analyze_vegetation_distribution,
+                    before_image, aoi_geometry, stats=batched_stats.get('vegetation')),
+                # 2. ANALYZE SEASONAL CONTEXT
+                'seasonal': functools.partial(
+                    self._analyze_seasonal_context,
+                    before_image, after_image, aoi_geometry, change_stats=batched_stats.get('seasonal')),
+                # 3. ANALYZE GEOGRAPHIC CONTEXT
+                'geographic': functools.partial(
+                    self._analyze_geographic_context,
+                    aoi_geometry, centroid=batched_stats.get('geographic')),
+                # 4. ANALYZE DATA QUALITY
+                'quality': functools.partial(
+                    self._analyze_data_quality,
+                    before_image, after_image, aoi_geometry, counts=batched_stats.get('quality'))
+            }
+            if batched_stats:
+                results = {name: analysis() for name, analysis in analyses.items()}
+            else:
+                # Each analysis now blocks on its own getInfo(); the EE client releases the
+                # GIL while waiting, so overlap them (bounded to stay clear of rate limits)
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    futures = {name: executor.submit(analysis) for name, analysis in analyses.items()}
+                    results = {name: future.result() for name, future in futures.items()}
+            vegetation_stats = results['vegetation']
+            seasonal_context = results['seasonal']
+            geographic_context = results['geographic']
+            data_quality = results['quality']
             
             # 5. INCORPORATE USER PREFERENCES
             user_context = self._process_user_preferences()
@@ -1625,37 +1701,45 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
                 data_quality, user_context
             )
             
-            print(f"✅ DATA ANALYSIS COMPLETE - Adaptive parameters calculated:")
-            print(f"   📊 Vegetation density: {vegetation_stats.get('density_category', 'unknown')}")
-            print(f"   🌱 Seasonal factor: {seasonal_context.get('seasonal_risk', 'unknown')}")
-            print(f"   🌍 Geographic type: {geographic_context.get('region_type', 'unknown')}")
-            print(f"   📡 Data quality: {data_quality.get('quality_score', 'unknown')}")
-            print(f"   👤 User sensitivity: {user_context.get('sensitivity_level', 'balanced')}")
+            logger.info("✅ DATA ANALYSIS COMPLETE - Adaptive parameters calculated:")
+            logger.debug("   📊 Vegetation density: %s", vegetation_stats.get('density_category', 'unknown'))
+            logger.debug("   🌱 Seasonal factor: %s", seasonal_context.get('seasonal_risk', 'unknown'))
+            logger.debug("   🌍 Geographic type: %s", geographic_context.get('region_type', 'unknown'))
+            logger.debug("   📡 Data quality: %s", data_quality.get('quality_score', 'unknown'))
+            logger.debug("   👤 User sensitivity: %s", user_context.get('sensitivity_level', 'balanced'))
             
             return adaptive_params
             
         except Exception as e:
-            print(f"⚠️ DATA ANALYSIS FAILED: {e}")
-            print("🔄 Using fallback conservative parameters")
+            logger.warning("⚠️ DATA ANALYSIS FAILED: %s", e)
+            logger.warning("🔄 Using fallback conservative parameters")
             return self._get_fallback_parameters()
     
-    def _analyze_vegetation_distribution(self, image, aoi_geometry):
-        """RESEARCH-BASED vegetation density distribution analysis with robust biome-specific adaptations"""
+    def _vegetation_distribution_stats(self, image, aoi_geometry):
+        """Server-side NDVI distribution statistics for _analyze_vegetation_distribution"""
+        # Calculate NDVI for the entire AOI
+        ndvi = self._calculate_quick_ndvi(image)
+        
+        # Get the vegetation statistics the analysis reads (no histogram payload)
+        return ndvi.reduceRegion(
+            reducer=ee.Reducer.percentile([5, 10, 50, 90, 95]).combine(
+                ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True), sharedInputs=True
+            ),
+            geometry=aoi_geometry,
+            scale=100,
+            maxPixels=1e7
+        )
+    
+    def _analyze_vegetation_distribution(self, image, aoi_geometry, stats=None):
+        """
+        RESEARCH-BASED vegetation density distribution analysis with robust biome-specific adaptations
+        
+        stats is the evaluated _vegetation_distribution_stats result when the caller has
+        already fetched it; otherwise it is fetched here.
+        """
         try:
-            # Calculate NDVI for the entire AOI
-            ndvi = self._calculate_quick_ndvi(image)
-            
-            # Get comprehensive vegetation statistics
-            stats = ndvi.reduceRegion(
-                reducer=ee.Reducer.histogram(maxBuckets=50).combine(
-                    ee.Reducer.percentile([5, 10, 25, 50, 75, 90, 95]), sharedInputs=True
-                ).combine(
-                    ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True), sharedInputs=True
-                ),
-                geometry=aoi_geometry,
-                scale=100,
-                maxPixels=1e7
-            ).getInfo()
+            if stats is None:
+                stats = self._vegetation_distribution_stats(image, aoi_geometry).getInfo()
             
             ndvi_mean = stats.get('NDVI_mean', 0.3)
             ndvi_std = stats.get('NDVI_stdDev', 0.2)
@@ -1699,7 +1783,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             
             # Dry/seasonal forest adaptation (common in India)
             if ndvi_mean < 0.35 and vegetation_range < 0.4:
-                print(f"🌿 DETECTED DRY/SEASONAL FOREST BIOME - Applying specialized settings")
+                logger.debug("🌿 DETECTED DRY/SEASONAL FOREST BIOME - Applying specialized settings")
                 base_threshold = max(0.025, base_threshold * 0.7)  # More sensitive threshold
                 sensitivity_multiplier = min(2.0, sensitivity_multiplier * 1.3)  # Enhanced sensitivity
                 density_category = f"{density_category}_dry_adapted"
@@ -1707,7 +1791,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             # Mixed agricultural-forest landscapes (heterogeneous areas)
             heterogeneity_factor = ndvi_std / max(ndvi_mean, 0.1)
             if heterogeneity_factor > 0.6:
-                print(f"🌿 DETECTED HETEROGENEOUS LANDSCAPE - Applying mixed-use settings")
+                logger.debug("🌿 DETECTED HETEROGENEOUS LANDSCAPE - Applying mixed-use settings")
                 # Slightly more conservative to handle agricultural false positives
                 base_threshold = min(0.12, base_threshold * 1.1)
                 sensitivity_multiplier = max(0.8, sensitivity_multiplier * 0.95)
@@ -1715,7 +1799,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             
             # Degraded forest recovery areas (intermediate NDVI with high variation)
             elif ndvi_mean > 0.25 and ndvi_mean < 0.5 and ndvi_std > 0.15:
-                print(f"🌿 DETECTED DEGRADED/RECOVERING FOREST - Applying recovery-adapted settings")
+                logger.debug("🌿 DETECTED DEGRADED/RECOVERING FOREST - Applying recovery-adapted settings")
                 # Balance between sensitivity and false positive control
                 base_threshold = base_threshold * 0.85
                 sensitivity_multiplier = sensitivity_multiplier * 1.1
@@ -1726,7 +1810,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             
             # Check for very low or very high percentiles (data quality indicators)
             if ndvi_p5 < -0.2 or ndvi_p95 > 0.95:
-                print(f"⚠️ POTENTIAL DATA QUALITY ISSUES - Applying conservative adjustments")
+                logger.warning("⚠️ POTENTIAL DATA QUALITY ISSUES - Applying conservative adjustments")
                 base_threshold = min(0.15, base_threshold * 1.2)  # More conservative
                 sensitivity_multiplier = max(0.7, sensitivity_multiplier * 0.9)
             
@@ -1734,11 +1818,11 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             base_threshold = max(0.02, min(0.15, base_threshold))
             sensitivity_multiplier = max(0.7, min(2.0, sensitivity_multiplier))
             
-            print(f"📊 VEGETATION ANALYSIS RESULTS:")
-            print(f"   Category: {density_category}")
-            print(f"   NDVI mean: {ndvi_mean:.3f}")
-            print(f"   Threshold: {base_threshold:.3f}")
-            print(f"   Sensitivity: {sensitivity_multiplier:.3f}")
+            logger.debug("📊 VEGETATION ANALYSIS RESULTS:")
+            logger.debug("   Category: %s", density_category)
+            logger.debug("   NDVI mean: %.3f", ndvi_mean)
+            logger.debug("   Threshold: %.3f", base_threshold)
+            logger.debug("   Sensitivity: %.3f", sensitivity_multiplier)
             
             return {
                 'density_category': density_category,
@@ -1758,7 +1842,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             }
             
         except Exception as e:
-            print(f"Vegetation analysis failed: {e}")
+            logger.warning("Vegetation analysis failed: %s", e)
             return {
                 'density_category': 'unknown', 
                 'base_threshold': 0.08, 
@@ -1767,21 +1851,25 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
                 'heterogeneity_factor': 0.5
             }
     
-    def _analyze_seasonal_context(self, before_image, after_image, aoi_geometry):
+    def _seasonal_change_stats(self, before_image, after_image, aoi_geometry):
+        """Server-side NDVI change statistics for _analyze_seasonal_context"""
+        # Estimate seasonal risk based on vegetation change patterns
+        before_ndvi = self._calculate_quick_ndvi(before_image)
+        after_ndvi = self._calculate_quick_ndvi(after_image)
+        
+        # Only the median and p90 of the change are used
+        return before_ndvi.subtract(after_ndvi).reduceRegion(
+            reducer=ee.Reducer.percentile([50, 90]),
+            geometry=aoi_geometry,
+            scale=100,
+            maxPixels=1e6
+        )
+    
+    def _analyze_seasonal_context(self, before_image, after_image, aoi_geometry, change_stats=None):
         """Analyze seasonal patterns to adapt filtering"""
         try:
-            # Estimate seasonal risk based on vegetation change patterns
-            before_ndvi = self._calculate_quick_ndvi(before_image)
-            after_ndvi = self._calculate_quick_ndvi(after_image)
-            
-            change_stats = before_ndvi.subtract(after_ndvi).reduceRegion(
-                reducer=ee.Reducer.histogram(maxBuckets=50).combine(
-                    ee.Reducer.percentile([10, 50, 90]), sharedInputs=True
-                ),
-                geometry=aoi_geometry,
-                scale=100,
-                maxPixels=1e6
-            ).getInfo()
+            if change_stats is None:
+                change_stats = self._seasonal_change_stats(before_image, after_image, aoi_geometry).getInfo()
             
             change_median = change_stats.get('NDVI_p50', 0)
             change_p90 = change_stats.get('NDVI_p90', 0)
@@ -1804,31 +1892,34 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             }
             
         except Exception as e:
-            print(f"Seasonal analysis failed: {e}")
+            logger.warning("Seasonal analysis failed: %s", e)
             return {'seasonal_risk': 'unknown', 'false_positive_factor': 0.8}
     
-    def _analyze_geographic_context(self, aoi_geometry):
+    @staticmethod
+    def _local_centroid(aoi_geometry):
+        """[lon, lat] of a client-side AOI computed locally, or None when it needs the server"""
+        if not SHAPELY_AVAILABLE:
+            return None
+        try:
+            # toGeoJSON() only works (without a request) for geometries built client-side
+            centroid = shapely_shape(aoi_geometry.toGeoJSON()).centroid
+            return [centroid.x, centroid.y]
+        except Exception:
+            return None
+    
+    def _analyze_geographic_context(self, aoi_geometry, centroid=None):
         """Analyze geographic context (latitude, region type)"""
         try:
-            # Get centroid coordinates
-            centroid = aoi_geometry.centroid().coordinates().getInfo()
+            # Get centroid coordinates ([longitude, latitude]) unless already fetched, locally when possible
+            if centroid is None:
+                centroid = self._local_centroid(aoi_geometry) or aoi_geometry.centroid().coordinates().getInfo()
             longitude = centroid[0]
             latitude = centroid[1]
             
             # Determine region characteristics based on coordinates
-            if 6 <= latitude <= 37 and 68 <= longitude <= 97:  # India bounds
-                if latitude > 30:
-                    region_type = "himalayan"
-                    climate_factor = 0.9  # More conservative in mountains
-                elif latitude < 15:
-                    region_type = "tropical"
-                    climate_factor = 1.1  # More sensitive in tropics
-                else:
-                    region_type = "subtropical"
-                    climate_factor = 1.0  # Standard
-            else:
-                region_type = "other"
-                climate_factor = 1.0
+            region = RegionType(_region_codes(latitude, longitude))
+            region_type = region.name.lower()
+            climate_factor = float(REGION_CLIMATE_FACTORS[region])
             
             return {
                 'region_type': region_type,
@@ -1838,27 +1929,31 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             }
             
         except Exception as e:
-            print(f"Geographic analysis failed: {e}")
+            logger.warning("Geographic analysis failed: %s", e)
             return {'region_type': 'unknown', 'climate_factor': 1.0}
     
-    def _analyze_data_quality(self, before_image, after_image, aoi_geometry):
-        """Analyze data quality indicators"""
-        try:
-            # Check for cloud cover, data gaps, etc.
-            # For now, simple pixel count check
-            before_count = before_image.select('B4').unmask().reduceRegion(
+    def _data_quality_counts(self, before_image, after_image, aoi_geometry):
+        """Server-side before/after pixel counts for _analyze_data_quality"""
+        # Check for cloud cover, data gaps, etc.
+        # For now, simple pixel count check: both dates stacked as bands, counted in one pass
+        return ee.Dictionary(
+            before_image.select([self.band_map['RED']], ['before']).unmask().addBands(
+                after_image.select([self.band_map['RED']], ['after']).unmask()
+            ).reduceRegion(
                 reducer=ee.Reducer.count(),
                 geometry=aoi_geometry,
                 scale=100,
                 maxPixels=1e6
-            ).getInfo().get('B4', 0)
-            
-            after_count = after_image.select('B4').unmask().reduceRegion(
-                reducer=ee.Reducer.count(),
-                geometry=aoi_geometry,
-                scale=100,
-                maxPixels=1e6
-            ).getInfo().get('B4', 0)
+            )
+        )
+    
+    def _analyze_data_quality(self, before_image, after_image, aoi_geometry, counts=None):
+        """Analyze data quality indicators"""
+        try:
+            if counts is None:
+                counts = self._data_quality_counts(before_image, after_image, aoi_geometry).getInfo()
+            before_count = counts.get('before') or 0
+            after_count = counts.get('after') or 0
             
             # Calculate quality score
             min_count = min(before_count, after_count)
@@ -1879,7 +1974,7 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             }
             
         except Exception as e:
-            print(f"Data quality analysis failed: {e}")
+            logger.warning("Data quality analysis failed: %s", e)
             return {'quality_score': 'unknown', 'confidence_factor': 0.8}
     
     def _process_user_preferences(self):
@@ -1890,19 +1985,10 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         priority = self.user_preferences.get('priority', 'balanced')  # detection, precision, balanced
         
         # Convert to multipliers
-        if sensitivity_level == 'high':
-            sensitivity_multiplier = 1.3
-        elif sensitivity_level == 'conservative':
-            sensitivity_multiplier = 0.7
-        else:  # balanced
-            sensitivity_multiplier = 1.0
-        
-        if false_positive_tolerance == 'low':
-            fp_factor = 0.6  # Aggressive filtering
-        elif false_positive_tolerance == 'high':
-            fp_factor = 0.9  # Light filtering
-        else:  # moderate
-            fp_factor = 0.75
+        sensitivity_code = _SENSITIVITY_CODES.get(sensitivity_level, SensitivityLevel.BALANCED)
+        fp_tolerance_code = _FP_TOLERANCE_CODES.get(false_positive_tolerance, FalsePositiveTolerance.MODERATE)
+        sensitivity_multiplier = SENSITIVITY_MULTIPLIERS[sensitivity_code]
+        fp_factor = FP_TOLERANCE_FACTORS[fp_tolerance_code]
         
         return {
             'sensitivity_level': sensitivity_level,
@@ -1933,15 +2019,15 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
         user_sensitivity = user_context.get('sensitivity_multiplier', 1.0)
         user_fp_factor = user_context.get('fp_factor', 0.75)
         
-        # Calculate final adaptive parameters
-        final_vegetation_threshold = base_threshold * confidence_factor
-        final_sensitivity_multiplier = sensitivity_multiplier * climate_factor * user_sensitivity
-        final_fp_factor = seasonal_factor * user_fp_factor
-        
-        # Ensure reasonable bounds
-        final_vegetation_threshold = max(0.03, min(0.2, final_vegetation_threshold))
-        final_sensitivity_multiplier = max(0.5, min(2.0, final_sensitivity_multiplier))
-        final_fp_factor = max(0.4, min(0.95, final_fp_factor))
+        # Calculate final adaptive parameters (single-AOI batch)
+        final_params = self._calculate_adaptive_parameters_batch(
+            np.array([[base_threshold, sensitivity_multiplier]]),
+            np.array([seasonal_factor]),
+            np.array([climate_factor]),
+            np.array([confidence_factor]),
+            np.array([[user_sensitivity, user_fp_factor]])
+        )
+        final_vegetation_threshold, final_sensitivity_multiplier, final_fp_factor = final_params[0].tolist()
         
         return {
             'vegetation_threshold': final_vegetation_threshold,
@@ -1957,20 +2043,38 @@ class DeforestationDetection(ChangeDetectionAlgorithm):
             }
         }
     
+    @staticmethod
+    def _calculate_adaptive_parameters_batch(veg_arr, seasonal_arr, geo_arr, quality_arr, user_arr):
+        """
+        Vectorised adaptive-parameter math for N AOIs at once.
+        
+        Args:
+            veg_arr: (N, 2) base_threshold, sensitivity_multiplier
+            seasonal_arr: (N,) seasonal false_positive_factor
+            geo_arr: (N,) climate_factor
+            quality_arr: (N,) confidence_factor
+            user_arr: (N, 2) user sensitivity_multiplier, fp_factor
+            
+        Returns:
+            (N, 3) vegetation_threshold, sensitivity_multiplier, false_positive_factor,
+            in the inputs' dtype (float32 inputs stay float32)
+        """
+        veg_arr = np.asarray(veg_arr)
+        user_arr = np.asarray(user_arr)
+        
+        final_params = np.stack([
+            veg_arr[:, 0] * quality_arr,
+            veg_arr[:, 1] * geo_arr * user_arr[:, 0],
+            seasonal_arr * user_arr[:, 1]
+        ], axis=-1)
+        
+        # Ensure reasonable bounds, one clip per column
+        np.clip(final_params, [0.03, 0.5, 0.4], [0.2, 2.0, 0.95], out=final_params)
+        return final_params
+    
     def _calculate_quick_ndvi(self, image):
-        """Quick NDVI calculation for analysis"""
-        try:
-            # Try standard bands first
-            nir = image.select('B8')
-            red = image.select('B4')
-            return nir.subtract(red).divide(nir.add(red)).rename('NDVI')
-        except:
-            # Fallback for different band naming
-            bands = image.bandNames().getInfo()
-            if 'NIR' in bands and 'RED' in bands:
-                return image.normalizedDifference(['NIR', 'RED']).rename('NDVI')
-            else:
-                return ee.Image.constant(0.3).rename('NDVI')  # Fallback constant
+        """Quick NDVI calculation for analysis, using the band names in self.band_map"""
+        return image.normalizedDifference([self.band_map['NIR'], self.band_map['RED']]).rename('NDVI')
     
     def _get_fallback_parameters(self):
         """Conservative fallback parameters when analysis fails"""
@@ -0,0 +1,44 @@
+"""The NumPy local standard deviation against a brute-force window reference"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("ee")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+advanced_algorithms = pytest.importorskip("ml.algorithms.advanced_algorithms")
+
+
+def _reference_local_std(array, size):
+    """Population std of every size x size window, edges mirrored (scipy 'reflect')"""
+    radius = size // 2
+    padded = np.pad(array.astype(np.float64), radius, mode='symmetric')
+    out = np.empty(array.shape, dtype=np.float64)
+    for i in range(array.shape[0]):
+        for j in range(array.shape[1]):
+            out[i, j] = padded[i:i + size, j:j + size].std()
+    return out
+
+
+@pytest.mark.parametrize("size", [3, 5])
+def test_local_std_matches_reference(size):
+    rng = np.random.default_rng(0)
+    nir = rng.uniform(0, 0.6, size=(23, 31)).astype(np.float32)
+
+    result = advanced_algorithms.MultiSensorFusionDetection._local_std_numpy(nir, size=size)
+
+    np.testing.assert_allclose(result, _reference_local_std(nir, size), atol=1e-4)
+
+
+def test_local_std_is_zero_on_constant_tile():
+    nir = np.full((10, 12), 0.3, dtype=np.float32)
+
+    result = advanced_algorithms.MultiSensorFusionDetection._local_std_numpy(nir)
+
+    # The older-SciPy path computes sqrt(E[x^2] - E[x]^2) in float32, so allow rounding
+    np.testing.assert_allclose(result, 0, atol=1e-3)
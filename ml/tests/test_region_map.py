@@ -0,0 +1,54 @@
+"""Boundary behaviour of the precomputed geographic region lookup"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("ee")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ml.algorithms.deforestation import RegionType, _region_codes  # noqa: E402
+
+
+def _reference_region(latitude, longitude):
+    """The comparison chain the lookup table replaces"""
+    if 6 <= latitude <= 37 and 68 <= longitude <= 97:  # India bounds
+        if latitude > 30:
+            return RegionType.HIMALAYAN
+        elif latitude < 15:
+            return RegionType.TROPICAL
+        return RegionType.SUBTROPICAL
+    return RegionType.OTHER
+
+
+@pytest.mark.parametrize("latitude, longitude, expected", [
+    (37.0, 80.0, RegionType.HIMALAYAN),      # inclusive upper latitude bound
+    (37.2, 80.0, RegionType.OTHER),
+    (30.0, 80.0, RegionType.SUBTROPICAL),    # 'latitude > 30' is exclusive
+    (30.2, 80.0, RegionType.HIMALAYAN),
+    (15.0, 80.0, RegionType.SUBTROPICAL),    # 'latitude < 15' is exclusive
+    (14.9, 80.0, RegionType.TROPICAL),
+    (6.0, 80.0, RegionType.TROPICAL),        # inclusive lower latitude bound
+    (5.9, 80.0, RegionType.OTHER),
+    (20.0, 97.0, RegionType.SUBTROPICAL),    # inclusive upper longitude bound
+    (20.0, 97.1, RegionType.OTHER),
+    (20.0, 68.0, RegionType.SUBTROPICAL),    # inclusive lower longitude bound
+    (20.0, 67.9, RegionType.OTHER),
+    (90.0, 180.0, RegionType.OTHER),         # grid edges
+    (-90.0, -180.0, RegionType.OTHER),
+])
+def test_region_bounds(latitude, longitude, expected):
+    assert RegionType(_region_codes(latitude, longitude)) == expected
+
+
+def test_region_codes_match_reference_in_batch():
+    latitudes = np.concatenate([np.arange(0, 45, 0.25), [29.999, 30.001, 36.999, 37.001]])
+    longitudes = np.concatenate([np.arange(60, 105, 0.25), [96.999, 97.001, 67.999, 68.001]])
+    lat_grid, lon_grid = np.meshgrid(latitudes, longitudes, indexing='ij')
+
+    codes = _region_codes(lat_grid, lon_grid)
+    expected = np.vectorize(_reference_region)(lat_grid, lon_grid)
+    np.testing.assert_array_equal(codes, expected)
@@ -0,0 +1,58 @@
+"""Output scale of the transformer algorithm's local-softmax attention"""
+
+import os
+import sys
+
+import pytest
+
+ee = pytest.importorskip("ee")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+advanced_algorithms = pytest.importorskip("ml.algorithms.advanced_algorithms")
+
+BANDS = ['B2', 'B3', 'B4', 'B8', 'B11']
+BEFORE = [0.05, 0.08, 0.06, 0.40, 0.20]
+AFTER = [0.07, 0.10, 0.12, 0.25, 0.28]
+
+
+@pytest.fixture(scope="module")
+def earth_engine():
+    try:
+        ee.Initialize()
+    except Exception as e:
+        pytest.skip(f"Earth Engine is not initialized: {e}")
+
+
+def _normalized_difference(values, first, second):
+    a, b = values[BANDS.index(first)], values[BANDS.index(second)]
+    return (a - b) / (a + b)
+
+
+def _expected_uniform_score():
+    """Band mean of |after - before| features: on uniform input every attention weight is 1"""
+    diffs = [
+        abs(_normalized_difference(AFTER, x, y) - _normalized_difference(BEFORE, x, y))
+        for x, y in (('B8', 'B4'), ('B11', 'B8'), ('B3', 'B11'))
+    ]
+    # The B2/B3/B4/B8 boxcar means at three radii equal the constant band values
+    diffs += [abs(AFTER[i] - BEFORE[i]) for i in range(4)] * 3
+    return sum(diffs) / len(diffs)
+
+
+def test_uniform_input_keeps_unit_attention_weights(earth_engine):
+    before = ee.Image.constant(BEFORE).rename(BANDS)
+    after = ee.Image.constant(AFTER).rename(BANDS)
+    algorithm = advanced_algorithms.TransformerChangeDetection()
+
+    score = algorithm._temporal_attention_fusion(
+        algorithm._extract_multiscale_features(before),
+        algorithm._extract_multiscale_features(after)
+    )
+    value = score.reduceRegion(
+        reducer=ee.Reducer.first(),
+        geometry=ee.Geometry.Point([78.0, 20.0]),
+        scale=30
+    ).values().get(0).getInfo()
+
+    assert value == pytest.approx(_expected_uniform_score(), rel=1e-4)